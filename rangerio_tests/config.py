@@ -2,20 +2,36 @@
 Test configuration pointing to RangerIO workspace
 """
 import os
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import List, Dict, Any
 
 # Configure logging for E2E tests
+# Records are handed to a queue and written to stderr by a listener thread, so
+# callers (and parallel xdist workers) never block on the stream lock.
+# QueueHandler.prepare() already applies the basicConfig format below.
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.StreamHandler(),
+        logging.handlers.QueueHandler(_log_queue),
     ]
 )
 logger = logging.getLogger("rangerio_tests")
+# basicConfig is a no-op once pytest's capture handlers are on the root logger;
+# pin the level so INFO summaries still reach caplog and the report
+logger.setLevel(logging.INFO)
 
 
 @dataclass
@@ -57,6 +73,12 @@ class TestConfig:
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_API_REQUESTS: bool = True  # Log all API requests/responses
     
+    # RAG evaluation cache (ragas scores keyed by input hash; delete or use --no-rag-cache to regenerate)
+    RAG_EVAL_CACHE_DIR: Path = TEST_ROOT / ".ragas_cache"
+    
+    # Indexed data sources reused across runs, keyed by backend + file identity (delete to re-ingest)
+    DATA_SOURCE_REGISTRY: Path = TEST_ROOT / ".rangerio_tests_cache" / "data_sources.json"
+    
     # Performance Thresholds - optimized for fast Granite models
     MAX_RESPONSE_TIME_MS: int = 60000   # 1 minute for LLM queries (fast models)
     MAX_RESPONSE_TIME_QUALITY_MS: int = 90000  # 1.5 min for quality tests (tiny model)
@@ -123,6 +145,20 @@ class TestConfig:
             return path
         raise FileNotFoundError(f"Test file not found: {filename}")
     
+    def first_generated_csv_files(self, limit: int) -> List[Path]:
+        """First `limit` CSV files in the generated data directory (stops scanning early)"""
+        files = []
+        try:
+            with os.scandir(self.USER_GENERATED_DATA_DIR) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".csv") and entry.is_file():
+                        files.append(Path(entry.path))
+                        if len(files) >= limit:
+                            break
+        except FileNotFoundError:
+            pass
+        return files
+    
     def list_user_test_files(self, pattern: str = "*") -> List[Path]:
         """List user test files matching pattern"""
         files = []
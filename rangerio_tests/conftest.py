@@ -3,10 +3,15 @@ Shared pytest fixtures for all tests
 """
 import pytest
 import asyncio
+import io
+import json
 import uuid
+from datetime import datetime
 from pathlib import Path
-from typing import Generator, Dict, Any, List
+from typing import Generator, Dict, Any, List, Optional, Callable
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from playwright.sync_api import sync_playwright, Browser, Page, BrowserContext
 import psutil
 import time
@@ -15,6 +20,41 @@ from rangerio_tests.config import config
 from rangerio_tests.utils.mode_config import get_mode, get_all_modes
 
 
+# ============================================================================
+# Command-Line Options
+# ============================================================================
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--http2",
+        action="store_true",
+        default=False,
+        help="Use httpx.AsyncClient with HTTP/2 multiplexing in throughput tests and the "
+             "concurrent golden query run (negotiated via TLS ALPN; plain http:// backends "
+             "stay on HTTP/1.1)"
+    )
+    parser.addoption(
+        "--no-rag-cache",
+        action="store_true",
+        default=False,
+        help="Don't reuse or store ragas scores in the on-disk evaluation cache "
+             "(config.RAG_EVAL_CACHE_DIR)"
+    )
+    parser.addoption(
+        "--force-rag-bench",
+        action="store_true",
+        default=False,
+        help="Rerun RAG benchmarks even if they already passed against an unchanged golden set"
+    )
+    parser.addoption(
+        "--cache-queries",
+        action="store_true",
+        default=False,
+        help="Reuse successful responses for identical read-only queries within the session "
+             "(tests using cached_api_client)"
+    )
+
+
 # ============================================================================
 # Session-Level Fixtures
 # ============================================================================
@@ -31,6 +71,12 @@ def rangerio_frontend_url() -> str:
     return config.RANGERIO_FRONTEND_URL
 
 
+@pytest.fixture(scope="session")
+def use_http2(request) -> bool:
+    """Whether throughput tests should use the HTTP/2 async client (--http2)"""
+    return request.config.getoption("--http2")
+
+
 @pytest.fixture(scope="session")
 def test_data_dir() -> Path:
     """Directory containing test data files"""
@@ -53,10 +99,63 @@ def reports_dir() -> Path:
 # Backend API Fixtures
 # ============================================================================
 
+# Block size for streamed request bodies (http.client/urllib3 default to 8-16 KiB reads)
+HTTP_UPLOAD_CHUNK = 1 << 20
+
+# Largest sample held in RAM for uploads; bigger files are streamed from disk
+IN_MEMORY_UPLOAD_MAX_BYTES = 100 * 1024 * 1024
+
+
+class _UploadHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections send streamed bodies in HTTP_UPLOAD_CHUNK blocks"""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("blocksize", HTTP_UPLOAD_CHUNK)
+        super().init_poolmanager(*args, **kwargs)
+
+
+class _MultipartFileStream:
+    """
+    File-like multipart/form-data body: the part headers, the file streamed
+    from disk, then the closing boundary. Exposes __len__ so requests sends
+    a fixed Content-Length instead of buffering or chunking the upload.
+    """
+    
+    def __init__(self, head: bytes, fileobj, file_size: int, tail: bytes):
+        self._parts = [io.BytesIO(head), fileobj, io.BytesIO(tail)]
+        self._length = len(head) + file_size + len(tail)
+    
+    def __len__(self):
+        return self._length
+    
+    def read(self, size=-1):
+        chunks = []
+        while self._parts and size != 0:
+            chunk = self._parts[0].read(size)
+            if not chunk:
+                self._parts.pop(0)
+                continue
+            chunks.append(chunk)
+            if size > 0:
+                size -= len(chunk)
+        return b"".join(chunks)
+
+
 @pytest.fixture(scope="session")
 def api_client(rangerio_backend_url):
     """HTTP client for API testing"""
     session = requests.Session()
+    # Size the connection pool for concurrent tests so worker threads reuse
+    # keep-alive connections instead of opening a new one per request.
+    # Dropped keep-alive connections are retried (idempotent methods only).
+    adapter = _UploadHTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        pool_block=False,
+        max_retries=Retry(total=3, backoff_factor=0.1)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
     # Don't set Content-Type globally - let requests handle it per request
     # (multipart/form-data for file uploads, application/json for JSON)
     
@@ -83,20 +182,73 @@ def api_client(rangerio_backend_url):
         def delete(self, endpoint, **kwargs):
             return self.session.delete(f"{self.base_url}{endpoint}", **kwargs)
         
-        def upload_file(self, endpoint, file_path: Path, data=None, **kwargs):
-            """Upload a file with optional form data"""
+        def upload_file(self, endpoint, file_path: Path, data=None, json_meta=None, **kwargs):
+            """
+            Upload a file with optional form data.
+            
+            json_meta fields are sent as application/json parts, so booleans arrive
+            as true/false rather than Python's str(True).
+            """
             with open(file_path, 'rb') as f:
                 files = {'file': (file_path.name, f)}
+                for name, value in (json_meta or {}).items():
+                    files[name] = (None, json.dumps(value), 'application/json')
                 # FastAPI Form() requires data to be passed as 'data' parameter, not 'json'
                 return self.post(endpoint, files=files, data=data, **kwargs)
+        
+        def _post_multipart(self, endpoint, filename: str, fileobj, size: int, data=None,
+                            json_meta=None, **kwargs):
+            """POST form fields plus one file part, streamed with a known Content-Length"""
+            boundary = uuid.uuid4().hex
+            head = b""
+            for name, value in (data or {}).items():
+                head += (
+                    f"--{boundary}\r\n"
+                    f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+                    f"{value}\r\n"
+                ).encode()
+            for name, value in (json_meta or {}).items():
+                head += (
+                    f"--{boundary}\r\n"
+                    f'Content-Disposition: form-data; name="{name}"\r\n'
+                    f"Content-Type: application/json\r\n\r\n"
+                    f"{json.dumps(value)}\r\n"
+                ).encode()
+            head += (
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+                f"Content-Type: application/octet-stream\r\n\r\n"
+            ).encode()
+            tail = f"\r\n--{boundary}--\r\n".encode()
+            
+            body = _MultipartFileStream(head, fileobj, size, tail)
+            # No Transfer-Encoding header: with a fixed length requests never chunks,
+            # and "identity" isn't a valid HTTP/1.1 coding (h11 rejects it)
+            headers = {
+                'Content-Type': f'multipart/form-data; boundary={boundary}',
+                'Content-Length': str(len(body)),
+            }
+            return self.post(endpoint, data=body, headers=headers, **kwargs)
+        
+        def upload_file_streaming(self, endpoint, file_path: Path, data=None, json_meta=None,
+                                  **kwargs):
+            """Upload a file as multipart/form-data streamed from disk with a known Content-Length"""
+            with open(file_path, 'rb') as f:
+                return self._post_multipart(endpoint, file_path.name, f, file_path.stat().st_size,
+                                            data=data, json_meta=json_meta, **kwargs)
+        
+        def upload_file_bytes(self, endpoint, content: bytes, filename: str, data=None,
+                              json_meta=None, **kwargs):
+            """Upload in-memory file content as multipart/form-data (no disk I/O)"""
+            return self._post_multipart(endpoint, filename, io.BytesIO(content), len(content),
+                                        data=data, json_meta=json_meta, **kwargs)
     
     yield APIClient(rangerio_backend_url)
     session.close()
 
 
-@pytest.fixture
-def create_test_rag(api_client):
-    """Create a test RAG with unique name and clean up after test"""
+def _rag_factory(api_client):
+    """Yield a RAG-creating callable, then delete every RAG it created"""
     created_rags = []
     
     def _create(name: str = "Test RAG", description: str = "Test RAG for automated testing"):
@@ -119,6 +271,51 @@ def create_test_rag(api_client):
             pass
 
 
+@pytest.fixture(scope="session")
+def cached_api_client(api_client, request):
+    """
+    api_client whose JSON POSTs are memoized by (endpoint, payload) when --cache-queries is set.
+    
+    Only for read-only queries: a cached 200 response is returned for repeats of the
+    same prompt against the same project. Without the flag it is plain api_client.
+    """
+    if not request.config.getoption("--cache-queries"):
+        return api_client
+    
+    class CachedAPIClient:
+        def __init__(self, client):
+            self._client = client
+            self._responses: Dict[str, requests.Response] = {}
+        
+        def __getattr__(self, name):
+            return getattr(self._client, name)
+        
+        def post(self, endpoint, **kwargs):
+            if "json" not in kwargs:
+                return self._client.post(endpoint, **kwargs)
+            key = f"{endpoint} {json.dumps(kwargs['json'], sort_keys=True)}"
+            if key not in self._responses:
+                response = self._client.post(endpoint, **kwargs)
+                if response.status_code != 200:
+                    return response
+                self._responses[key] = response
+            return self._responses[key]
+    
+    return CachedAPIClient(api_client)
+
+
+@pytest.fixture
+def create_test_rag(api_client):
+    """Create a test RAG with unique name and clean up after test"""
+    yield from _rag_factory(api_client)
+
+
+@pytest.fixture(scope="session")
+def create_session_rag(api_client):
+    """Create a test RAG with unique name and clean up at the end of the session"""
+    yield from _rag_factory(api_client)
+
+
 # ============================================================================
 # Frontend E2E Fixtures (Playwright)
 # ============================================================================
@@ -270,6 +467,37 @@ def financial_sample() -> Path:
     return path
 
 
+@pytest.fixture(scope="session")
+def financial_sample_size(financial_sample) -> int:
+    """Size of Financial Sample.xlsx in bytes, stat'ed once per session"""
+    return financial_sample.stat().st_size
+
+
+@pytest.fixture(scope="session")
+def sample_bytes() -> Callable[[Path], Optional[bytes]]:
+    """
+    Read sample files into RAM once per session, so timed uploads don't hit a cold disk.
+    Returns None for files too large to hold in memory; callers stream those from disk.
+    """
+    cache: Dict[Path, Optional[bytes]] = {}
+    
+    def _load(path: Path) -> Optional[bytes]:
+        if path not in cache:
+            if path.stat().st_size >= IN_MEMORY_UPLOAD_MAX_BYTES:
+                cache[path] = None
+            else:
+                cache[path] = path.read_bytes()
+        return cache[path]
+    
+    return _load
+
+
+@pytest.fixture(scope="session")
+def financial_sample_bytes(financial_sample, sample_bytes) -> Optional[bytes]:
+    """Financial Sample.xlsx content held in RAM (None if over the in-memory limit)"""
+    return sample_bytes(financial_sample)
+
+
 @pytest.fixture
 def user_pii_csv() -> Path:
     """CSV file with PII data (customers_pii.csv)"""
@@ -333,10 +561,10 @@ def user_outliers_csv() -> Path:
     return path
 
 
-@pytest.fixture
-def all_user_csv_files() -> List[Path]:
-    """All CSV files from user test directory"""
-    return list(config.USER_GENERATED_DATA_DIR.glob("*.csv"))
+@pytest.fixture(scope="session")
+def available_csv_files() -> List[Path]:
+    """Up to 15 generated CSV files, scanned once per session"""
+    return config.first_generated_csv_files(15)
 
 
 @pytest.fixture
@@ -429,11 +657,19 @@ def wait_for_frontend(authenticated_page):
     return True
 
 
-@pytest.fixture
-def rag_evaluator(rangerio_backend_url):
-    """RAG evaluator with ragas integration"""
+@pytest.fixture(scope="session")
+def rag_evaluator(rangerio_backend_url, request):
+    """
+    RAG evaluator with ragas integration (session-scoped: stateless, so one instance is shared).
+    
+    ragas scores are cached on disk across runs unless --no-rag-cache is given.
+    """
     from rangerio_tests.utils.rag_evaluator import RAGEvaluator
-    return RAGEvaluator(backend_url=rangerio_backend_url, model_name=config.DEFAULT_MODEL)
+    cache_dir = None if request.config.getoption("--no-rag-cache") else config.RAG_EVAL_CACHE_DIR
+    evaluator = RAGEvaluator(backend_url=rangerio_backend_url, model_name=config.DEFAULT_MODEL,
+                             cache_dir=cache_dir)
+    yield evaluator
+    evaluator.close()
 
 
 @pytest.fixture(scope="session")  # Session-scoped: shared across all tests
@@ -453,8 +689,17 @@ def interactive_validator(request, golden_output_dir):
 # Pytest Hooks - Generate ONE Consolidated HTML Report at End
 # ============================================================================
 
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Expose each phase's report on the item (item.rep_setup / rep_call / rep_teardown) for fixtures"""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+
 def pytest_sessionfinish(session, exitstatus):
-    """Generate ONE consolidated HTML report with all validation items after all tests complete"""
+    """Generate ONE consolidated HTML report with all validation items after all tests complete,
+    plus a performance baseline if the session profiler recorded metrics"""
     # Get validator from config
     if hasattr(session.config, '_interactive_validator'):
         validator = session.config._interactive_validator
@@ -475,6 +720,25 @@ def pytest_sessionfinish(session, exitstatus):
             print(f"   4. Check issue boxes and add notes")
             print(f"   5. Click 'Export Results' when done")
             print(f"{'='*70}\n")
+    
+    # Write a performance baseline aggregated over the whole session (per xdist worker)
+    if hasattr(session.config, '_performance_profiler'):
+        profiler = session.config._performance_profiler
+        
+        if len(profiler.metrics) > 0:
+            perf_dir = config.REPORTS_DIR / "perf"
+            perf_dir.mkdir(parents=True, exist_ok=True)
+            # Under xdist each worker profiles its own tests: one baseline file per worker
+            worker_id = getattr(session.config, 'workerinput', {}).get('workerid')
+            suffix = f"_{worker_id}" if worker_id else ""
+            report_path = perf_dir / f"baseline_{datetime.now().strftime('%Y%m%d')}{suffix}.json"
+            with open(report_path, 'w') as f:
+                json.dump({
+                    'generated_at': datetime.now().isoformat(),
+                    'total_measurements': len(profiler.metrics),
+                    'operations': profiler.summary(),
+                }, f, indent=2)
+            print(f"\n📈 Performance baseline ({len(profiler.metrics)} measurements): {report_path}")
 
 
 # ============================================================================
@@ -900,13 +900,13 @@ class TestTaskQueue:
         else:
             logger.info("Import completed synchronously (no task_id returned)")
     
-    def test_batch_import_task_tracking(self, api_client, create_test_rag, all_user_csv_files):
+    def test_batch_import_task_tracking(self, api_client, create_test_rag, available_csv_files):
         """Test task tracking during batch import"""
-        if len(all_user_csv_files) < 3:
+        if len(available_csv_files) < 3:
             pytest.skip("Need at least 3 CSV files for batch import test")
         
         rag_id = create_test_rag("Batch Task Test")
-        test_files = all_user_csv_files[:3]
+        test_files = available_csv_files[:3]
         
         logger.info(f"Starting batch import of {len(test_files)} files...")
         
@@ -963,15 +963,15 @@ class TestTaskQueue:
         completed = final_summary.get('completed', 0)
         logger.info(f"✅ Task lifecycle: Completed tasks = {completed}")
     
-    def test_grouped_task_hierarchy(self, api_client, create_test_rag, all_user_csv_files):
+    def test_grouped_task_hierarchy(self, api_client, create_test_rag, available_csv_files):
         """Test grouped tasks endpoint for parent/child hierarchy"""
-        if len(all_user_csv_files) < 2:
+        if len(available_csv_files) < 2:
             pytest.skip("Need at least 2 CSV files for grouped task test")
         
         rag_id = create_test_rag("Grouped Task Test")
         
         # Import multiple files to create a batch
-        for csv_file in all_user_csv_files[:2]:
+        for csv_file in available_csv_files[:2]:
             response = api_client.upload_file(
                 "/datasources/connect",
                 csv_file,
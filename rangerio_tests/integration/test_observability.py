@@ -16,10 +16,11 @@ Good observability is essential for:
 import pytest
 import time
 import psutil
-from pathlib import Path
+import orjson
 from typing import Dict, Any, List
 
-from rangerio_tests.config import config, logger
+from rangerio_tests.config import logger
+from rangerio_tests.utils.wait_utils import backoff_intervals
 
 
 # ============================================================================
@@ -201,14 +202,14 @@ class TestTaskObservability:
         
         logger.info(f"Found {len(groups)} task groups")
     
-    def test_task_details_include_progress(self, api_client, observability_rag):
+    def test_task_details_include_progress(self, api_client, observability_rag, available_csv_files):
         """
         Individual task details should include progress info.
         
         Progress tracking is essential for user feedback.
         """
         # Start an import to create a task
-        csv_files = list(Path(config.USER_GENERATED_DATA_DIR).glob("*.csv"))[:2]
+        csv_files = available_csv_files[:2]
         if not csv_files:
             pytest.skip("No CSV files for task progress test")
         
@@ -458,11 +459,11 @@ class TestLogging:
         
         logger.info("Query operation completed - logs should be generated")
     
-    def test_task_operations_logged(self, api_client, observability_rag):
+    def test_task_operations_logged(self, api_client, observability_rag, available_csv_files):
         """
         Task creation and completion should be logged.
         """
-        csv_files = list(Path(config.USER_GENERATED_DATA_DIR).glob("*.csv"))[:1]
+        csv_files = available_csv_files[:1]
         if not csv_files:
             pytest.skip("No CSV files for logging test")
         
@@ -494,12 +495,12 @@ class TestMetricsAccuracy:
         # Get summary
         summary_resp = api_client.get("/tasks/summary")
         assert summary_resp.status_code == 200
-        summary = summary_resp.json()
+        summary = orjson.loads(summary_resp.content)
         
-        # Get all tasks
+        # Get all tasks (parse raw bytes - the groups list can be large)
         grouped_resp = api_client.get("/tasks/grouped")
         assert grouped_resp.status_code == 200
-        grouped = grouped_resp.json()
+        grouped = orjson.loads(grouped_resp.content)
         
         # Count from grouped
         groups = grouped.get("groups", [])
@@ -517,11 +518,11 @@ class TestMetricsAccuracy:
             assert variance < 0.5 or total_from_summary >= len(groups), \
                 f"Task counts inconsistent: summary={total_from_summary}, groups={len(groups)}"
     
-    def test_progress_updates_accurately(self, api_client, observability_rag):
+    def test_progress_updates_accurately(self, api_client, observability_rag, available_csv_files):
         """
         Task progress should update as work completes.
         """
-        csv_files = list(Path(config.USER_GENERATED_DATA_DIR).glob("*.csv"))[:3]
+        csv_files = available_csv_files[:3]
         if len(csv_files) < 2:
             pytest.skip("Not enough CSV files for progress test")
         
@@ -537,9 +538,11 @@ class TestMetricsAccuracy:
         
         job_id = response.json().get("job_id")
         
-        # Track progress over time
+        # Track progress over time - poll densely at first, then back off
         progress_readings = []
-        for _ in range(10):
+        intervals = backoff_intervals()
+        deadline = time.monotonic() + 60
+        for _ in range(20):
             status_resp = api_client.get(f"/datasources/import/{job_id}/status")
             if status_resp.status_code == 200:
                 status = status_resp.json()
@@ -549,7 +552,9 @@ class TestMetricsAccuracy:
                 if status.get("status") in ["completed", "failed"]:
                     break
             
-            time.sleep(2)
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(next(intervals))
         
         # Progress should generally increase
         if len(progress_readings) > 2:
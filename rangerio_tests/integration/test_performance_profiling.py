@@ -12,16 +12,25 @@ Test Categories:
 - Resource utilization tracking
 """
 import pytest
+import asyncio
+import json
+import logging
+import os
 import time
+import httpx
 import psutil
-import statistics
+import threading
+import uuid
+import itertools
+import numpy as np
 from pathlib import Path
-from typing import Dict, Any, List
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait as wait_futures, TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass
 from datetime import datetime
 
 from rangerio_tests.config import config, logger
+from rangerio_tests.utils.wait_utils import wait_for_import_indexed
 
 
 # ============================================================================
@@ -40,22 +49,91 @@ QUERY_MEMORY_SPIKE_MAX = 500  # Max memory increase per query batch
 
 # Throughput Baselines
 MIN_QUERIES_PER_MINUTE = 5  # Minimum queries per minute
+QUERY_THROUGHPUT_CONCURRENCY = 4  # Queries kept in flight when measuring query throughput
 MIN_IMPORTS_PER_MINUTE = 10  # Minimum file imports per minute (small files)
+IMPORT_THROUGHPUT_WORKERS = 8  # Concurrent uploads when measuring import throughput
 
 # Import Performance
-SMALL_FILE_IMPORT_MAX_S = 10  # Max seconds for <1MB file import
+SMALL_FILE_IMPORT_MAX_S = 10  # Max seconds for <1MB file import (full pipeline)
+SMALL_FILE_IMPORT_RAW_MAX_S = 5  # Max seconds for <1MB file import with profiling skipped
+MEDIUM_FILE_IMPORT_MAX_S = 30  # Max seconds for a 5K-row CSV import (full pipeline)
 LARGE_FILE_IMPORT_MAX_S = 60  # Max seconds for 10-50MB file import
 
+# Sample fixture imported for each file-size bucket
+IMPORT_BUCKET_SAMPLES = {
+    "small": "financial_sample",
+    "medium": "sample_csv_large",
+}
+
+# Batch import job status poll interval (no import event stream to subscribe to)
+BATCH_STATUS_POLL_INTERVAL = 0.1
+
+# Connection warmup
+POOL_WARMUP_REQUESTS = 3  # Health requests issued per test class to prime the pool
+HEALTH_WARMUP_READINGS = 5  # Leading health readings discarded as cold-start outliers
+
+# Parallel import
+PARALLEL_IMPORT_WORKERS = 5  # Concurrent /datasources/connect uploads
+PARALLEL_IMPORT_SPEEDUP_MIN = 3.0  # Parallel files/sec must be >= 3x serial
+
 # Ingestion wait
-RAG_INGESTION_WAIT = 45  # seconds to wait for RAG indexing
+RAG_INGESTION_WAIT = 45  # fallback wait when indexing status can't be polled
+
+# Queries used for response time percentile measurements
+PERCENTILE_QUERIES = (
+    "What is the total sales revenue?",
+    "How many products are in the dataset?",
+    "What are the main categories?",
+    "Summarize the financial performance",
+    "What is the profit margin?",
+    "List the top selling products",
+    "What is the average discount?",
+    "Show monthly sales trends",
+    "What are the key metrics?",
+    "Describe the dataset",
+    "What is the total profit?",
+    "How many transactions are there?",
+    "What is the highest sale?",
+    "What is the lowest sale?",
+    "What are the segments?",
+    "Show country breakdown",
+    "What is year over year growth?",
+    "What is the manufacturing cost?",
+    "What products have highest margin?",
+    "What is the sales distribution?",
+)
+
+# Peak memory sampling interval inside a measurement (seconds)
+MEMORY_SAMPLE_INTERVAL = 0.1
+
+# Command-line marker of the backend process (`python -m api.server`)
+BACKEND_PROCESS_MARKER = "api.server"
+
+# Structured perf records, one JSON object per line, for CI trend tracking
+PERF_METRICS_FILE = config.REPORTS_DIR / "perf-metrics.jsonl"
+
+perf_logger = logging.getLogger("rangerio_tests.perf.jsonl")
+if not perf_logger.handlers:
+    # delay: the file is only opened by the first record, not at import/collection
+    _perf_handler = logging.FileHandler(PERF_METRICS_FILE, delay=True)
+    _perf_handler.setFormatter(logging.Formatter("%(message)s"))
+    perf_logger.addHandler(_perf_handler)
+    perf_logger.setLevel(logging.INFO)
+    perf_logger.propagate = False
+
+
+def log_perf_metric(test: str, **fields):
+    """Append a structured perf record for `test` to PERF_METRICS_FILE."""
+    record = {'test': test, **fields, 'ts': time.time(), 'git_sha': os.environ.get('GITHUB_SHA')}
+    perf_logger.info(json.dumps(record))
 
 
 @dataclass
 class PerformanceMetrics:
     """Container for performance measurement results."""
     operation: str
-    start_time: datetime
-    end_time: datetime
+    start_time: float  # Unix timestamp
+    end_time: float  # Unix timestamp
     duration_s: float
     memory_start_mb: float
     memory_end_mb: float
@@ -66,6 +144,8 @@ class PerformanceMetrics:
     def to_dict(self) -> Dict[str, Any]:
         return {
             'operation': self.operation,
+            'start_time': datetime.fromtimestamp(self.start_time).isoformat(),
+            'end_time': datetime.fromtimestamp(self.end_time).isoformat(),
             'duration_s': self.duration_s,
             'memory_delta_mb': self.memory_end_mb - self.memory_start_mb,
             'memory_peak_mb': self.memory_peak_mb,
@@ -80,18 +160,29 @@ class PerformanceProfiler:
     def __init__(self):
         self.process = psutil.Process()
         self.metrics: List[PerformanceMetrics] = []
+        # Prime the CPU counter so the first non-blocking read is meaningful
+        self.process.cpu_percent(interval=None)
         
     def measure(self, operation: str):
         """Context manager for measuring an operation."""
         return PerformanceMeasurement(self, operation)
     
     def get_memory_mb(self) -> float:
-        """Get current memory usage in MB."""
+        """Get current memory usage (RSS) in MB."""
         return self.process.memory_info().rss / (1024 * 1024)
     
+    def get_memory_uss_mb(self) -> float:
+        """
+        Get unique set size in MB - memory not shared with other processes.
+        
+        Slower than get_memory_mb() (reads smaps), so use it for start/end
+        anchors rather than high-frequency sampling.
+        """
+        return self.process.memory_full_info().uss / (1024 * 1024)
+    
     def get_cpu_percent(self) -> float:
-        """Get current CPU usage percentage."""
-        return self.process.cpu_percent(interval=0.1)
+        """Get CPU usage percentage since the previous call (non-blocking)."""
+        return self.process.cpu_percent(interval=None)
     
     def record_metric(self, metric: PerformanceMetrics):
         """Record a performance metric."""
@@ -99,51 +190,96 @@ class PerformanceProfiler:
         logger.info(f"[PERF] {metric.operation}: {metric.duration_s:.2f}s, "
                    f"Memory: {metric.memory_start_mb:.0f}MB -> {metric.memory_end_mb:.0f}MB")
     
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-operation duration percentiles over all recorded metrics."""
+        durations: Dict[str, List[float]] = {}
+        for metric in self.metrics:
+            durations.setdefault(metric.operation, []).append(metric.duration_s)
+        return {
+            operation: {'count': len(values), **self.calculate_percentiles(values)}
+            for operation, values in durations.items()
+        }
+    
     def calculate_percentiles(self, values: List[float]) -> Dict[str, float]:
-        """Calculate P50, P95, P99 percentiles."""
+        """Calculate P50, P95, P99 and P99.9 percentiles (linear interpolation)."""
         if not values:
-            return {'p50': 0, 'p95': 0, 'p99': 0}
+            return {'p50': 0, 'p95': 0, 'p99': 0, 'p999': 0}
         
-        sorted_values = sorted(values)
-        n = len(sorted_values)
+        # np.percentile selects the bracketing ranks with np.partition
+        # (introselect, O(N)) rather than a full sort
+        a = np.asarray(values, dtype=np.float64)
+        p50, p95, p99, p999 = np.percentile(a, [50, 95, 99, 99.9], method='linear')
         
         return {
-            'p50': sorted_values[int(n * 0.50)] if n > 1 else sorted_values[0],
-            'p95': sorted_values[int(n * 0.95)] if n > 19 else sorted_values[-1],
-            'p99': sorted_values[int(n * 0.99)] if n > 99 else sorted_values[-1],
-            'min': sorted_values[0],
-            'max': sorted_values[-1],
-            'mean': statistics.mean(sorted_values),
-            'stdev': statistics.stdev(sorted_values) if n > 1 else 0
+            'p50': float(p50),
+            'p95': float(p95),
+            'p99': float(p99),
+            'p999': float(p999),
+            'min': float(a.min()),
+            'max': float(a.max()),
+            'mean': float(a.mean()),
+            'stdev': float(a.std(ddof=1)) if a.size > 1 else 0.0
         }
 
 
+def find_backend_process() -> Optional[psutil.Process]:
+    """Locate the local RangerIO backend process, or None if it isn't running here."""
+    for proc in psutil.process_iter(['cmdline']):
+        cmdline = proc.info.get('cmdline') or []
+        if BACKEND_PROCESS_MARKER in ' '.join(cmdline):
+            return proc
+    return None
+
+
 class PerformanceMeasurement:
-    """Context manager for individual performance measurements."""
+    """Context manager for individual performance measurements.
+    
+    Peak memory is tracked by a background sampler thread so spikes between
+    the start and end readings are not missed. Timing uses perf_counter_ns,
+    taken last on enter and first on exit so setup stays outside the window.
+    """
+    
+    __slots__ = ('profiler', 'operation', 'start_time', '_start_ns', 'start_memory',
+                 'peak_memory', 'success', 'details', '_stop', '_sampler')
     
     def __init__(self, profiler: PerformanceProfiler, operation: str):
         self.profiler = profiler
         self.operation = operation
         self.start_time = None
+        self._start_ns = None
         self.start_memory = None
         self.peak_memory = None
         self.success = True
         self.details = {}
+        self._stop = threading.Event()
+        self._sampler = None
+        
+    def _sample_peak_memory(self):
+        while not self._stop.wait(MEMORY_SAMPLE_INTERVAL):
+            current = self.profiler.get_memory_mb()
+            if current > self.peak_memory:
+                self.peak_memory = current
         
     def __enter__(self):
-        self.start_time = datetime.now()
         self.start_memory = self.profiler.get_memory_mb()
         self.peak_memory = self.start_memory
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample_peak_memory, daemon=True)
+        self._sampler.start()
+        self.start_time = time.time()
+        self._start_ns = time.perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        end_time = datetime.now()
+        duration_s = (time.perf_counter_ns() - self._start_ns) / 1e9
+        end_time = self.start_time + duration_s
+        self._stop.set()
+        self._sampler.join(timeout=0.5)
         end_memory = self.profiler.get_memory_mb()
         
         # Track peak memory
-        current_memory = end_memory
-        if current_memory > self.peak_memory:
-            self.peak_memory = current_memory
+        if end_memory > self.peak_memory:
+            self.peak_memory = end_memory
         
         if exc_type is not None:
             self.success = False
@@ -152,7 +288,7 @@ class PerformanceMeasurement:
             operation=self.operation,
             start_time=self.start_time,
             end_time=end_time,
-            duration_s=(end_time - self.start_time).total_seconds(),
+            duration_s=duration_s,
             memory_start_mb=self.start_memory,
             memory_end_mb=end_memory,
             memory_peak_mb=self.peak_memory,
@@ -168,16 +304,77 @@ class PerformanceMeasurement:
 # Fixtures
 # ============================================================================
 
-@pytest.fixture
-def profiler():
-    """Fresh performance profiler for each test."""
-    return PerformanceProfiler()
+@pytest.fixture(scope="session")
+def profiler(request):
+    """
+    Session-wide performance profiler.
+    
+    Each measurement is independent; only the metrics list is shared, so
+    pytest_sessionfinish can write a whole-session baseline report.
+    """
+    profiler = PerformanceProfiler()
+    request.config._performance_profiler = profiler
+    return profiler
+
+
+@pytest.fixture(scope="class", autouse=True)
+def warmup_connection_pool(api_client):
+    """Prime keep-alive connections once per test class so handshakes aren't timed."""
+    for _ in range(POOL_WARMUP_REQUESTS):
+        try:
+            api_client.get("/health", timeout=5)
+        except Exception as e:
+            logger.warning(f"Connection pool warmup failed: {e}")
+            break
+
+
+@pytest.fixture(scope="class")
+def perf_rag(api_client):
+    """Empty RAG shared by the import tests of a class, deleted after the class."""
+    response = api_client.post("/projects", json={
+        "name": f"Import Performance RAG_{uuid.uuid4().hex[:8]}",
+        "description": "RAG for import performance testing"
+    })
+    assert response.status_code == 200, f"Failed to create RAG: {response.text}"
+    rag_id = response.json()["id"]
+    
+    yield rag_id
+    
+    try:
+        api_client.delete(f"/projects/{rag_id}")
+    except Exception as e:
+        logger.warning(f"Failed to cleanup RAG {rag_id}: {e}")
 
 
 @pytest.fixture
+async def async_api_client(api_client, use_http2):
+    """Async httpx client against the same backend; HTTP/2 when --http2 is given."""
+    async with httpx.AsyncClient(base_url=api_client.base_url, timeout=120,
+                                 http2=use_http2) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def query_latency_collector():
+    """Collect per-query latencies from parametrized tests; report percentiles at session end."""
+    latencies: Dict[str, float] = {}
+    yield latencies
+    
+    if latencies:
+        percentiles = PerformanceProfiler().calculate_percentiles(list(latencies.values()))
+        logger.info(f"Per-query latency ({len(latencies)} queries) - "
+                   f"P50: {percentiles['p50']:.2f}s, P95: {percentiles['p95']:.2f}s, "
+                   f"P99: {percentiles['p99']:.2f}s")
+
+
+@pytest.fixture(scope="session")
 def profiling_rag(api_client, financial_sample):
-    """Create a RAG with financial data for profiling tests."""
-    import uuid
+    """
+    Create a RAG with financial data for profiling tests.
+    
+    Session-scoped: tests only query it, so one indexed project is shared.
+    Tests that import data create their own projects.
+    """
     response = api_client.post("/projects", json={
         "name": f"Performance Profiling RAG_{uuid.uuid4().hex[:8]}",
         "description": "RAG for performance baseline testing"
@@ -192,10 +389,17 @@ def profiling_rag(api_client, financial_sample):
         data={'project_id': str(rag_id), 'source_type': 'file'}
     )
     assert response.status_code == 200, f"Failed to import: {response.text}"
+    upload_result = response.json()
+    data_source_id = upload_result.get("id") or upload_result.get("data_source_id")
     
-    # Wait for indexing
-    logger.info(f"Waiting for RAG indexing ({RAG_INGESTION_WAIT}s)...")
-    time.sleep(RAG_INGESTION_WAIT)
+    # Wait for indexing - poll readiness, fixed wait only if we can't identify the source
+    if data_source_id:
+        logger.info(f"Waiting for data source {data_source_id} to be indexed...")
+        if not wait_for_import_indexed(api_client, data_source_id, max_wait=60):
+            logger.warning(f"Data source {data_source_id} not confirmed indexed, continuing")
+    else:
+        logger.warning(f"No data_source_id in upload response, waiting {RAG_INGESTION_WAIT}s")
+        time.sleep(RAG_INGESTION_WAIT)
     
     logger.info(f"Created profiling RAG: {rag_id}")
     yield rag_id
@@ -207,6 +411,82 @@ def profiling_rag(api_client, financial_sample):
         logger.warning(f"Failed to cleanup RAG {rag_id}: {e}")
 
 
+async def run_query_throughput(base_url: str, rag_id: int, prompt: str,
+                               concurrency: int, window_s: float,
+                               http2: bool = False) -> Dict[str, Any]:
+    """
+    Keep `concurrency` queries in flight against /rag/query for `window_s` seconds.
+    
+    Returns status codes of every completed request and latencies of the
+    successful ones, so callers can derive both throughput and percentiles.
+    With http2=True the queries are multiplexed over a single connection.
+    """
+    status_codes: List[int] = []
+    latencies: List[float] = []
+    start = time.perf_counter()
+    
+    async with httpx.AsyncClient(base_url=base_url, timeout=120, http2=http2) as client:
+        async def worker():
+            while time.perf_counter() - start < window_s:
+                request_start = time.perf_counter()
+                try:
+                    response = await client.post("/rag/query", json={
+                        "prompt": prompt,
+                        "project_id": rag_id,
+                        "assistant_mode": True
+                    })
+                    status_codes.append(response.status_code)
+                    if response.status_code == 200:
+                        latencies.append(time.perf_counter() - request_start)
+                except httpx.HTTPError as e:
+                    logger.warning(f"Throughput query failed: {e}")
+                    status_codes.append(0)
+        
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    
+    return {
+        'status_codes': status_codes,
+        'latencies': latencies,
+        'elapsed_s': time.perf_counter() - start
+    }
+
+
+async def run_import_throughput(base_url: str, rag_id: int, files: List[Path],
+                                concurrency: int, window_s: float,
+                                http2: bool = False) -> Dict[str, Any]:
+    """
+    Upload `files` with up to `concurrency` in flight, starting no new upload
+    after `window_s` seconds. Returns the status code of each attempted upload.
+    """
+    status_codes: List[int] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    start = time.perf_counter()
+    
+    async with httpx.AsyncClient(base_url=base_url, timeout=120, http2=http2) as client:
+        async def import_file(path: Path):
+            async with semaphore:
+                if time.perf_counter() - start >= window_s:
+                    return
+                try:
+                    with open(path, 'rb') as f:
+                        response = await client.post(
+                            "/datasources/connect",
+                            files={'file': (path.name, f)},
+                            data={'project_id': str(rag_id), 'source_type': 'file'}
+                        )
+                    status_codes.append(response.status_code)
+                except httpx.HTTPError as e:
+                    logger.warning(f"Import of {path.name} failed: {e}")
+                    status_codes.append(0)
+        
+        await asyncio.gather(*(import_file(path) for path in files))
+    
+    return {
+        'status_codes': status_codes,
+        'elapsed_s': time.perf_counter() - start
+    }
+
+
 # ============================================================================
 # Response Time Percentile Tests
 # ============================================================================
@@ -217,87 +497,91 @@ def profiling_rag(api_client, financial_sample):
 class TestResponseTimePercentiles:
     """Tests that measure and enforce response time percentiles."""
     
-    def test_query_response_time_percentiles(self, api_client, profiling_rag, profiler):
+    @pytest.mark.parametrize("query", PERCENTILE_QUERIES)
+    def test_single_query_latency(self, api_client, profiling_rag, query,
+                                  query_latency_collector, record_property):
+        """
+        Each query should complete within the P99 budget.
+        
+        Latencies are independent per query, so this runs in parallel under
+        pytest-xdist; percentiles are aggregated by query_latency_collector.
+        """
+        start = time.perf_counter()
+        response = api_client.post("/rag/query", json={
+            "prompt": query,
+            "project_id": profiling_rag
+        }, timeout=120)
+        elapsed = time.perf_counter() - start
+        
+        query_latency_collector[query] = elapsed
+        record_property("latency_s", elapsed)
+        logger.info(f"  [{elapsed:.2f}s] {query[:40]}...")
+        
+        assert response.status_code == 200, f"Query failed: {response.status_code}"
+        assert elapsed <= QUERY_P99_MAX, \
+            f"Query too slow: {elapsed:.2f}s > {QUERY_P99_MAX}s"
+    
+    def test_query_latency_benchmark(self, benchmark, api_client, profiling_rag):
         """
         P50 should be under 15s, P95 under 45s, P99 under 90s.
         
+        Query latency is measured by pytest-benchmark (one round per percentile
+        query, after warmup). Save a baseline with --benchmark-autosave and gate
+        regressions with --benchmark-compare --benchmark-compare-fail=median:10%.
+        
         This is a strict test - failures indicate the RAG system is too slow
         and needs optimization (better retrieval, faster LLM, caching).
         """
-        queries = [
-            "What is the total sales revenue?",
-            "How many products are in the dataset?",
-            "What are the main categories?",
-            "Summarize the financial performance",
-            "What is the profit margin?",
-            "List the top selling products",
-            "What is the average discount?",
-            "Show monthly sales trends",
-            "What are the key metrics?",
-            "Describe the dataset",
-            "What is the total profit?",
-            "How many transactions are there?",
-            "What is the highest sale?",
-            "What is the lowest sale?",
-            "What are the segments?",
-            "Show country breakdown",
-            "What is year over year growth?",
-            "What is the manufacturing cost?",
-            "What products have highest margin?",
-            "What is the sales distribution?",
-        ]
+        queries = itertools.cycle(PERCENTILE_QUERIES)
         
-        response_times = []
+        def run_query():
+            response = api_client.post("/rag/query", json={
+                "prompt": next(queries),
+                "project_id": profiling_rag
+            }, timeout=120)
+            assert response.status_code == 200, f"Query failed: {response.status_code}"
+        
+        benchmark.pedantic(run_query, rounds=len(PERCENTILE_QUERIES), warmup_rounds=2, iterations=1)
         
-        for query in queries:
-            with profiler.measure(f"query: {query[:30]}..."):
-                start = time.time()
-                response = api_client.post("/rag/query", json={
-                    "prompt": query,
-                    "project_id": profiling_rag
-                }, timeout=120)
-                elapsed = time.time() - start
-                response_times.append(elapsed)
-                
-                # Log individual results
-                status = "✓" if response.status_code == 200 else "✗"
-                logger.info(f"  {status} [{elapsed:.2f}s] {query[:40]}...")
-        
-        # Calculate percentiles
-        percentiles = profiler.calculate_percentiles(response_times)
+        if benchmark.stats is None:  # --benchmark-disable
+            return
+        stats = benchmark.stats.stats
+        # pytest-benchmark reports median/max but no tail percentiles: take those from the rounds
+        p95, p99 = np.percentile(stats.data, [95, 99])
         
         logger.info(f"\n{'='*60}")
-        logger.info(f"RESPONSE TIME PERCENTILES ({len(response_times)} queries)")
+        logger.info(f"RESPONSE TIME PERCENTILES ({stats.rounds} queries)")
         logger.info(f"{'='*60}")
-        logger.info(f"  P50: {percentiles['p50']:.2f}s (max: {QUERY_P50_MAX}s)")
-        logger.info(f"  P95: {percentiles['p95']:.2f}s (max: {QUERY_P95_MAX}s)")
-        logger.info(f"  P99: {percentiles['p99']:.2f}s (max: {QUERY_P99_MAX}s)")
-        logger.info(f"  Min: {percentiles['min']:.2f}s")
-        logger.info(f"  Max: {percentiles['max']:.2f}s")
-        logger.info(f"  Mean: {percentiles['mean']:.2f}s")
-        logger.info(f"  StdDev: {percentiles['stdev']:.2f}s")
+        logger.info(f"  P50: {stats.median:.2f}s (max: {QUERY_P50_MAX}s)")
+        logger.info(f"  P95: {p95:.2f}s (max: {QUERY_P95_MAX}s)")
+        logger.info(f"  P99: {p99:.2f}s (max: {QUERY_P99_MAX}s)")
+        logger.info(f"  Min: {stats.min:.2f}s")
+        logger.info(f"  Max: {stats.max:.2f}s")
+        logger.info(f"  Mean: {stats.mean:.2f}s")
+        logger.info(f"  StdDev: {stats.stddev:.2f}s")
         logger.info(f"{'='*60}\n")
         
         # Strict assertions - these should fail if performance degrades
-        assert percentiles['p50'] <= QUERY_P50_MAX, \
-            f"P50 too slow: {percentiles['p50']:.2f}s > {QUERY_P50_MAX}s"
-        assert percentiles['p95'] <= QUERY_P95_MAX, \
-            f"P95 too slow: {percentiles['p95']:.2f}s > {QUERY_P95_MAX}s"
-        assert percentiles['p99'] <= QUERY_P99_MAX, \
-            f"P99 too slow: {percentiles['p99']:.2f}s > {QUERY_P99_MAX}s"
+        assert stats.median <= QUERY_P50_MAX, \
+            f"P50 too slow: {stats.median:.2f}s > {QUERY_P50_MAX}s"
+        assert p95 <= QUERY_P95_MAX, \
+            f"P95 too slow: {p95:.2f}s > {QUERY_P95_MAX}s"
+        assert p99 <= QUERY_P99_MAX, \
+            f"P99 too slow: {p99:.2f}s > {QUERY_P99_MAX}s"
     
     def test_health_endpoint_latency(self, api_client, profiler):
         """Health endpoint should respond in under 100ms (P99)."""
         response_times = []
         
-        for _ in range(50):
-            start = time.time()
+        for _ in range(HEALTH_WARMUP_READINGS + 50):
+            start = time.perf_counter()
             response = api_client.get("/health")
-            elapsed = time.time() - start
+            elapsed = time.perf_counter() - start
             response_times.append(elapsed * 1000)  # Convert to ms
             assert response.status_code == 200
         
-        percentiles = profiler.calculate_percentiles(response_times)
+        # Discard cold-start readings so they don't dominate P99
+        percentiles = profiler.calculate_percentiles(response_times[HEALTH_WARMUP_READINGS:])
         
         logger.info(f"Health endpoint latency - P50: {percentiles['p50']:.2f}ms, "
                    f"P99: {percentiles['p99']:.2f}ms")
@@ -329,8 +613,8 @@ class TestMemoryProfiling:
         api_client.get("/health")
         time.sleep(1)
         
-        baseline_memory = profiler.get_memory_mb()
-        logger.info(f"Baseline memory usage: {baseline_memory:.2f}MB (max: {BASELINE_MEMORY_MAX}MB)")
+        baseline_memory = profiler.get_memory_uss_mb()
+        logger.info(f"Baseline memory usage (USS): {baseline_memory:.2f}MB (max: {BASELINE_MEMORY_MAX}MB)")
         
         assert baseline_memory < BASELINE_MEMORY_MAX, \
             f"Baseline memory too high: {baseline_memory:.2f}MB > {BASELINE_MEMORY_MAX}MB. " \
@@ -346,7 +630,7 @@ class TestMemoryProfiling:
         - Missing garbage collection
         """
         # Get baseline
-        baseline_memory = profiler.get_memory_mb()
+        baseline_uss = profiler.get_memory_uss_mb()
         
         # Create a test RAG for this import
         response = api_client.post("/projects", json={
@@ -357,26 +641,20 @@ class TestMemoryProfiling:
         rag_id = response.json()["id"]
         
         try:
-            # Measure memory during import
-            with profiler.measure("file_import"):
+            # Measure memory during import (peak tracked by the measurement's sampler)
+            with profiler.measure("file_import") as measurement:
                 response = api_client.upload_file(
                     "/datasources/connect",
                     financial_sample,
                     data={'project_id': str(rag_id), 'source_type': 'file'}
                 )
                 assert response.status_code == 200
-                
-                # Check memory at multiple points
-                peak_memory = baseline_memory
-                for _ in range(10):
-                    current = profiler.get_memory_mb()
-                    if current > peak_memory:
-                        peak_memory = current
-                    time.sleep(0.5)
             
-            memory_spike = peak_memory - baseline_memory
+            # Peak is sampled as RSS, so compare it against the RSS start reading
+            memory_spike = measurement.peak_memory - measurement.start_memory
+            uss_delta = profiler.get_memory_uss_mb() - baseline_uss
             logger.info(f"Memory spike during import: {memory_spike:.2f}MB "
-                       f"(max: {IMPORT_MEMORY_SPIKE_MAX}MB)")
+                       f"(max: {IMPORT_MEMORY_SPIKE_MAX}MB), USS delta: {uss_delta:+.2f}MB")
             
             assert memory_spike < IMPORT_MEMORY_SPIKE_MAX, \
                 f"Memory spike during import too high: {memory_spike:.2f}MB > {IMPORT_MEMORY_SPIKE_MAX}MB"
@@ -399,7 +677,7 @@ class TestMemoryProfiling:
             "project_id": profiling_rag
         }, timeout=120)
         time.sleep(2)
-        baseline_memory = profiler.get_memory_mb()
+        baseline_memory = profiler.get_memory_uss_mb()
         
         # Run batch of queries
         for i in range(10):
@@ -410,7 +688,7 @@ class TestMemoryProfiling:
         
         # Check memory growth
         time.sleep(2)
-        final_memory = profiler.get_memory_mb()
+        final_memory = profiler.get_memory_uss_mb()
         memory_growth = final_memory - baseline_memory
         
         logger.info(f"Memory growth after 10 queries: {memory_growth:.2f}MB "
@@ -431,7 +709,7 @@ class TestMemoryProfiling:
 class TestThroughput:
     """Tests that measure system throughput."""
     
-    def test_query_throughput(self, api_client, profiling_rag, profiler):
+    def test_query_throughput(self, api_client, profiling_rag, profiler, use_http2):
         """
         Should handle at least 5 queries per minute.
         
@@ -440,40 +718,35 @@ class TestThroughput:
         - No request queuing
         - Database contention
         """
-        start_time = time.time()
-        successful_queries = 0
-        failed_queries = 0
-        
-        # Run queries for 60 seconds
-        while time.time() - start_time < 60:
-            response = api_client.post("/rag/query", json={
-                "prompt": "What is the total revenue?",
-                "project_id": profiling_rag
-            }, timeout=120)
-            
-            if response.status_code == 200:
-                successful_queries += 1
-            else:
-                failed_queries += 1
+        # Keep several queries in flight for 60 seconds
+        result = asyncio.run(run_query_throughput(
+            api_client.base_url, profiling_rag, "What is the total revenue?",
+            concurrency=QUERY_THROUGHPUT_CONCURRENCY, window_s=60, http2=use_http2
+        ))
         
-        qpm = successful_queries  # Queries per minute
+        successful_queries = sum(1 for code in result['status_codes'] if code == 200)
+        failed_queries = len(result['status_codes']) - successful_queries
+        qpm = successful_queries / result['elapsed_s'] * 60  # Queries per minute
         error_rate = failed_queries / (successful_queries + failed_queries) if (successful_queries + failed_queries) > 0 else 1
+        latency_pct = profiler.calculate_percentiles(result['latencies'])
         
         logger.info(f"\n{'='*60}")
         logger.info(f"THROUGHPUT RESULTS (60 second window)")
         logger.info(f"{'='*60}")
-        logger.info(f"  Queries per minute: {qpm} (min: {MIN_QUERIES_PER_MINUTE})")
+        logger.info(f"  Queries per minute: {qpm:.1f} (min: {MIN_QUERIES_PER_MINUTE})")
+        logger.info(f"  Concurrency: {QUERY_THROUGHPUT_CONCURRENCY} (HTTP/2: {use_http2})")
         logger.info(f"  Successful: {successful_queries}")
         logger.info(f"  Failed: {failed_queries}")
         logger.info(f"  Error rate: {error_rate*100:.1f}%")
+        logger.info(f"  Latency P50: {latency_pct['p50']:.2f}s, P95: {latency_pct['p95']:.2f}s")
         logger.info(f"{'='*60}\n")
         
         assert qpm >= MIN_QUERIES_PER_MINUTE, \
-            f"Query throughput too low: {qpm} qpm < {MIN_QUERIES_PER_MINUTE} qpm"
+            f"Query throughput too low: {qpm:.1f} qpm < {MIN_QUERIES_PER_MINUTE} qpm"
         assert error_rate < 0.1, \
             f"Error rate too high: {error_rate*100:.1f}% >= 10%"
     
-    def test_import_throughput(self, api_client, user_test_files_dir, profiler):
+    def test_import_throughput(self, api_client, available_csv_files, profiler, use_http2):
         """
         Should handle at least 10 small file imports per minute.
         
@@ -489,28 +762,49 @@ class TestThroughput:
         })
         assert response.status_code == 200
         rag_id = response.json()["id"]
+        futures = []
         
         try:
             # Find small CSV files
-            csv_files = list(Path(config.USER_GENERATED_DATA_DIR).glob("*.csv"))[:15]
+            csv_files = available_csv_files[:15]
             if len(csv_files) < 5:
                 pytest.skip("Not enough CSV files for throughput test")
             
+            def import_file(csv_file: Path) -> int:
+                """Upload one file and return the status code (0 on error)."""
+                try:
+                    response = api_client.upload_file(
+                        "/datasources/connect",
+                        csv_file,
+                        data={'project_id': str(rag_id), 'source_type': 'file'}
+                    )
+                    return response.status_code
+                except Exception as e:
+                    logger.warning(f"Import of {csv_file.name} failed: {e}")
+                    return 0
+            
             start_time = time.time()
             successful_imports = 0
             
-            # Import files for up to 60 seconds
-            for csv_file in csv_files:
-                if time.time() - start_time >= 60:
-                    break
-                
-                response = api_client.upload_file(
-                    "/datasources/connect",
-                    csv_file,
-                    data={'project_id': str(rag_id), 'source_type': 'file'}
-                )
-                if response.status_code == 200:
-                    successful_imports += 1
+            if use_http2:
+                # Multiplex uploads over one HTTP/2 connection
+                result = asyncio.run(run_import_throughput(
+                    api_client.base_url, rag_id, csv_files,
+                    concurrency=IMPORT_THROUGHPUT_WORKERS, window_s=60, http2=True
+                ))
+                successful_imports = sum(1 for code in result['status_codes'] if code == 200)
+            else:
+                # Submit all imports concurrently and count completions for up to 60 seconds
+                executor = ThreadPoolExecutor(max_workers=IMPORT_THROUGHPUT_WORKERS)
+                futures = [executor.submit(import_file, csv_file) for csv_file in csv_files]
+                try:
+                    for future in as_completed(futures, timeout=60):
+                        if future.result() == 200:
+                            successful_imports += 1
+                except FuturesTimeoutError:
+                    logger.warning("Import throughput window elapsed with uploads still in flight")
+                finally:
+                    executor.shutdown(wait=False, cancel_futures=True)
             
             elapsed = time.time() - start_time
             imports_per_minute = (successful_imports / elapsed) * 60
@@ -522,6 +816,10 @@ class TestThroughput:
                 f"Import throughput too low: {imports_per_minute:.1f} < {MIN_IMPORTS_PER_MINUTE}/min"
         
         finally:
+            # Uploads already running when the window closed still write into the
+            # project: let them finish before deleting it (futures cancelled by
+            # shutdown(cancel_futures=True) never count as done for wait())
+            wait_futures([future for future in futures if not future.cancelled()])
             api_client.delete(f"/projects/{rag_id}")
 
 
@@ -542,41 +840,38 @@ class TestResourceUtilization:
         This test collects data rather than asserting limits,
         to help identify optimization opportunities.
         """
-        cpu_samples = []
+        # Measure CPU time consumed by the backend across the query; fall back
+        # to system-wide CPU times when the backend runs on another host
+        backend = find_backend_process()
+        cpu_source = backend.cpu_times if backend else psutil.cpu_times
+        num_cpus = psutil.cpu_count() or 1
         
-        # Sample CPU during a query
-        def sample_cpu():
-            for _ in range(30):
-                cpu_samples.append(psutil.cpu_percent(interval=0.1))
-        
-        import threading
-        sampler = threading.Thread(target=sample_cpu)
-        sampler.start()
-        
-        # Run query while sampling
+        before = cpu_source()
+        start = time.perf_counter()
         response = api_client.post("/rag/query", json={
             "prompt": "Provide a comprehensive analysis of the financial data",
             "project_id": profiling_rag
         }, timeout=120)
+        wall_s = time.perf_counter() - start
+        after = cpu_source()
         
-        sampler.join()
+        cpu_s = (after.user - before.user) + (after.system - before.system)
+        cores_busy = cpu_s / wall_s if wall_s > 0 else 0
+        avg_cpu = cores_busy * 100 / num_cpus
         
-        if cpu_samples:
-            avg_cpu = statistics.mean(cpu_samples)
-            max_cpu = max(cpu_samples)
-            
-            logger.info(f"\n{'='*60}")
-            logger.info(f"CPU UTILIZATION DURING QUERY")
-            logger.info(f"{'='*60}")
-            logger.info(f"  Average: {avg_cpu:.1f}%")
-            logger.info(f"  Peak: {max_cpu:.1f}%")
-            logger.info(f"  Samples: {len(cpu_samples)}")
-            logger.info(f"{'='*60}\n")
-            
-            # This is informational - high CPU during LLM inference is expected
-            # But sustained 100% might indicate issues
-            if avg_cpu > 95:
-                logger.warning("CPU consistently at 100% - potential bottleneck")
+        logger.info(f"\n{'='*60}")
+        logger.info(f"CPU UTILIZATION DURING QUERY")
+        logger.info(f"{'='*60}")
+        logger.info(f"  Source: {'backend pid ' + str(backend.pid) if backend else 'system-wide'}")
+        logger.info(f"  Average: {avg_cpu:.1f}% of {num_cpus} CPUs")
+        logger.info(f"  Cores busy: {cores_busy:.2f}")
+        logger.info(f"  CPU time: {cpu_s:.2f}s over {wall_s:.2f}s wall")
+        logger.info(f"{'='*60}\n")
+        
+        # This is informational - high CPU during LLM inference is expected
+        # But sustained 100% might indicate issues
+        if avg_cpu > 95:
+            logger.warning("CPU consistently at 100% - potential bottleneck")
     
     def test_memory_stability_over_time(self, api_client, profiling_rag, profiler):
         """
@@ -587,7 +882,7 @@ class TestResourceUtilization:
         memory_readings = []
         
         # Baseline
-        memory_readings.append(profiler.get_memory_mb())
+        memory_readings.append(profiler.get_memory_uss_mb())
         
         # Run 5 queries with memory checks
         for i in range(5):
@@ -596,11 +891,11 @@ class TestResourceUtilization:
                 "project_id": profiling_rag
             }, timeout=120)
             time.sleep(2)
-            memory_readings.append(profiler.get_memory_mb())
+            memory_readings.append(profiler.get_memory_uss_mb())
         
         # Calculate trend
-        first_half_avg = statistics.mean(memory_readings[:3])
-        second_half_avg = statistics.mean(memory_readings[3:])
+        first_half_avg = float(np.mean(memory_readings[:3]))
+        second_half_avg = float(np.mean(memory_readings[3:]))
         trend = second_half_avg - first_half_avg
         
         logger.info(f"Memory trend: {trend:+.2f}MB (first half: {first_half_avg:.0f}MB, "
@@ -621,84 +916,225 @@ class TestResourceUtilization:
 class TestImportPerformance:
     """Tests that validate import speed for different file sizes."""
     
-    def test_small_file_import_speed(self, api_client, financial_sample, profiler):
-        """Small files (<1MB) should import in under 10 seconds."""
-        # Create test RAG
-        response = api_client.post("/projects", json={
-            "name": f"Small File Speed Test_{uuid.uuid4().hex[:8]}",
-            "description": "Testing small file import speed"
-        })
-        assert response.status_code == 200
-        rag_id = response.json()["id"]
+    def _warm_up_import(self, api_client, rag_id, warmup_file: Path):
+        """
+        Push a tiny file through the import path before timing.
         
+        The first /datasources/connect pays for lazy imports (pandas, pyarrow)
+        and DB pool setup; that cold-start cost shouldn't count against the budget.
+        """
+        warmup_file.write_text("a,b\n1,2\n")
         try:
-            with profiler.measure("small_file_import"):
-                start = time.time()
-                response = api_client.upload_file(
+            response = api_client.upload_file(
+                "/datasources/connect",
+                warmup_file,
+                data={'project_id': str(rag_id), 'source_type': 'file'},
+                json_meta={'skip_profiling': True}
+            )
+        except Exception as e:
+            logger.warning(f"Import warmup failed: {e}")
+            return
+        
+        if response.status_code != 200:
+            logger.warning(f"Import warmup returned {response.status_code}")
+            return
+        ds_id = response.json().get("id") or response.json().get("data_source_id")
+        if ds_id:
+            try:
+                api_client.delete(f"/datasources/{ds_id}")
+            except Exception as e:
+                logger.warning(f"Failed to cleanup warmup data source {ds_id}: {e}")
+    
+    @pytest.fixture
+    def sample_for_bucket(self, request, bucket) -> Path:
+        """Sample file for a size bucket, resolved from IMPORT_BUCKET_SAMPLES"""
+        path = request.getfixturevalue(IMPORT_BUCKET_SAMPLES[bucket])
+        if not path.exists():
+            pytest.skip(f"No {bucket} import sample at {path}")
+        return path
+    
+    def _timed_import(self, api_client, rag_id, sample: Path, sample_size: int,
+                      content: Optional[bytes], profiler, warmup_file: Path, label: str,
+                      skip_profiling: bool, budget_s: float):
+        """
+        Import a sample file into the RAG and enforce the time budget.
+        
+        Uploads from `content` when the sample is cached in RAM, otherwise streams from disk.
+        """
+        variant = "raw" if skip_profiling else "full"
+        data = {'project_id': str(rag_id), 'source_type': 'file'}
+        json_meta = {'skip_profiling': skip_profiling}
+        
+        self._warm_up_import(api_client, rag_id, warmup_file)
+        
+        with profiler.measure(f"{label}_file_import_{variant}"):
+            start = time.perf_counter()
+            if content is not None:
+                response = api_client.upload_file_bytes(
                     "/datasources/connect",
-                    financial_sample,
-                    data={'project_id': str(rag_id), 'source_type': 'file'}
+                    content,
+                    filename=sample.name,
+                    data=data,
+                    json_meta=json_meta
                 )
-                elapsed = time.time() - start
-            
-            assert response.status_code == 200
-            
-            file_size_mb = financial_sample.stat().st_size / (1024 * 1024)
-            logger.info(f"Small file ({file_size_mb:.2f}MB) imported in {elapsed:.2f}s "
-                       f"(max: {SMALL_FILE_IMPORT_MAX_S}s)")
-            
-            assert elapsed < SMALL_FILE_IMPORT_MAX_S, \
-                f"Small file import too slow: {elapsed:.2f}s > {SMALL_FILE_IMPORT_MAX_S}s"
+            else:
+                response = api_client.upload_file_streaming(
+                    "/datasources/connect",
+                    sample,
+                    data=data,
+                    json_meta=json_meta
+                )
+            elapsed = time.perf_counter() - start
         
-        finally:
-            api_client.delete(f"/projects/{rag_id}")
+        assert response.status_code == 200
+        # The upload must go out with a fixed length, not chunked
+        assert 'Transfer-Encoding' not in response.request.headers
+        assert response.request.headers.get('Content-Length') is not None
+        
+        file_size_mb = sample_size / (1024 * 1024)
+        logger.info(f"{label.capitalize()} file ({file_size_mb:.2f}MB, {variant}) imported in "
+                   f"{elapsed:.2f}s (max: {budget_s}s)")
+        log_perf_metric(f"{label}_file_import_{variant}", size_mb=file_size_mb,
+                        elapsed_s=elapsed, budget_s=budget_s)
+        
+        assert elapsed < budget_s, \
+            f"{label.capitalize()} file import ({variant}) too slow: {elapsed:.2f}s > {budget_s}s"
     
-    def test_batch_import_efficiency(self, api_client, profiler):
+    def test_small_file_import_speed_raw(self, api_client, perf_rag, financial_sample,
+                                         financial_sample_size, financial_sample_bytes,
+                                         profiler, tmp_path):
+        """Small files (<1MB) should ingest in under 5 seconds with profiling skipped."""
+        self._timed_import(api_client, perf_rag, financial_sample, financial_sample_size,
+                           financial_sample_bytes, profiler, tmp_path / "warmup.csv", "small",
+                           skip_profiling=True, budget_s=SMALL_FILE_IMPORT_RAW_MAX_S)
+    
+    @pytest.mark.parametrize("bucket, budget_s", [
+        ("small", SMALL_FILE_IMPORT_MAX_S),
+        ("medium", MEDIUM_FILE_IMPORT_MAX_S),
+    ])
+    def test_import_speed_by_bucket(self, api_client, perf_rag, sample_for_bucket, bucket,
+                                    budget_s, sample_bytes, profiler, tmp_path):
+        """
+        Each size bucket should import within its budget including profiling.
+        
+        All buckets share the class-scoped perf_rag, so a run only pays for its upload.
+        """
+        self._timed_import(api_client, perf_rag, sample_for_bucket, sample_for_bucket.stat().st_size,
+                           sample_bytes(sample_for_bucket), profiler, tmp_path / "warmup.csv", bucket,
+                           skip_profiling=False, budget_s=budget_s)
+    
+    async def test_batch_import_efficiency(self, async_api_client, perf_rag,
+                                           available_csv_files, profiler):
         """Batch import should be more efficient than individual imports."""
         # Find multiple files
-        csv_files = list(Path(config.USER_GENERATED_DATA_DIR).glob("*.csv"))[:5]
+        csv_files = available_csv_files[:5]
         if len(csv_files) < 3:
             pytest.skip("Not enough CSV files for batch test")
         
-        # Create test RAG
-        response = api_client.post("/projects", json={
-            "name": f"Batch Import Test_{uuid.uuid4().hex[:8]}",
-            "description": "Testing batch import efficiency"
-        })
-        assert response.status_code == 200
-        rag_id = response.json()["id"]
+        async def poll_job(job_id: str):
+            # Poll at a fixed short interval so batch_time is within 100ms of completion
+            while True:
+                status_resp = await async_api_client.get(f"/datasources/import/{job_id}/status")
+                if status_resp.status_code != 200:
+                    return
+                status = status_resp.json()
+                if status.get("status") in ["completed", "failed"]:
+                    return
+                await asyncio.sleep(BATCH_STATUS_POLL_INTERVAL)
+        
+        # Time batch import
+        with profiler.measure("batch_import"):
+            start = time.perf_counter()
+            response = await async_api_client.post("/datasources/import/start", json={
+                "files": [str(f) for f in csv_files],
+                "project_id": perf_rag,
+                "skip_profiling": True
+            })
+            assert response.status_code == 200
+            job_id = response.json()["job_id"]
+            
+            poller = asyncio.create_task(poll_job(job_id))
+            try:
+                await asyncio.wait_for(poller, timeout=120)
+            except asyncio.TimeoutError:
+                logger.warning(f"Batch import job {job_id} still running after 120s")
+        
+        batch_time = time.perf_counter() - start
+        files_per_second = len(csv_files) / batch_time if batch_time > 0 else 0
+        
+        logger.info(f"Batch import of {len(csv_files)} files in {batch_time:.2f}s "
+                   f"({files_per_second:.2f} files/sec)")
+        log_perf_metric("batch_import", files_count=len(csv_files), elapsed_s=batch_time,
+                        files_per_sec=files_per_second)
+        
+        # Should process at least 0.1 files/second
+        assert files_per_second >= 0.1, \
+            f"Batch import too slow: {files_per_second:.2f} files/sec"
+    
+    def test_batch_import_parallel_efficiency(self, api_client, available_csv_files, profiler):
+        """
+        Parallel uploads should be at least 3x faster than serial uploads.
+        
+        A low speedup indicates the server serializes imports (global lock,
+        single-threaded task queue, DB write contention).
+        """
+        csv_files = available_csv_files[:5]
+        if len(csv_files) < 3:
+            pytest.skip("Not enough CSV files for parallel batch test")
+        
+        rag_ids = []
+        for mode in ("Serial", "Parallel"):
+            response = api_client.post("/projects", json={
+                "name": f"{mode} Import Test_{uuid.uuid4().hex[:8]}",
+                "description": "Testing parallel import efficiency"
+            })
+            assert response.status_code == 200
+            rag_ids.append(response.json()["id"])
+        serial_rag_id, parallel_rag_id = rag_ids
+        
+        def import_file(csv_file: Path, rag_id: int) -> int:
+            response = api_client.upload_file(
+                "/datasources/connect",
+                csv_file,
+                data={'project_id': str(rag_id), 'source_type': 'file'}
+            )
+            return response.status_code
         
         try:
-            # Time batch import
-            with profiler.measure("batch_import"):
-                response = api_client.post("/datasources/import/start", json={
-                    "files": [str(f) for f in csv_files],
-                    "project_id": rag_id,
-                    "skip_profiling": True
-                })
-                assert response.status_code == 200
-                job_id = response.json()["job_id"]
-                
-                # Wait for completion
-                start = time.time()
-                while time.time() - start < 120:
-                    status_resp = api_client.get(f"/datasources/import/{job_id}/status")
-                    if status_resp.status_code != 200:
-                        break
-                    status = status_resp.json()
-                    if status.get("status") in ["completed", "failed"]:
-                        break
-                    time.sleep(2)
+            # Serial baseline
+            with profiler.measure("serial_import"):
+                start = time.perf_counter()
+                serial_ok = sum(1 for f in csv_files if import_file(f, serial_rag_id) == 200)
+                serial_time = time.perf_counter() - start
             
-            batch_time = time.time() - start
-            files_per_second = len(csv_files) / batch_time if batch_time > 0 else 0
+            # Parallel uploads - one failed file shouldn't sink the batch
+            parallel_ok = 0
+            with profiler.measure("parallel_import"):
+                start = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=PARALLEL_IMPORT_WORKERS) as executor:
+                    futures = {executor.submit(import_file, f, parallel_rag_id): f for f in csv_files}
+                    for future in as_completed(futures):
+                        try:
+                            if future.result() == 200:
+                                parallel_ok += 1
+                        except Exception as e:
+                            logger.warning(f"Parallel import of {futures[future].name} failed: {e}")
+                parallel_time = time.perf_counter() - start
             
-            logger.info(f"Batch import of {len(csv_files)} files in {batch_time:.2f}s "
-                       f"({files_per_second:.2f} files/sec)")
+            serial_fps = serial_ok / serial_time if serial_time > 0 else 0
+            parallel_fps = parallel_ok / parallel_time if parallel_time > 0 else 0
+            speedup = parallel_fps / serial_fps if serial_fps > 0 else 0
             
-            # Should process at least 0.1 files/second
-            assert files_per_second >= 0.1, \
-                f"Batch import too slow: {files_per_second:.2f} files/sec"
+            logger.info(f"Serial: {serial_ok}/{len(csv_files)} files in {serial_time:.2f}s "
+                       f"({serial_fps:.2f} files/sec)")
+            logger.info(f"Parallel ({PARALLEL_IMPORT_WORKERS} workers): {parallel_ok}/{len(csv_files)} "
+                       f"files in {parallel_time:.2f}s ({parallel_fps:.2f} files/sec)")
+            logger.info(f"Speedup: {speedup:.2f}x (min: {PARALLEL_IMPORT_SPEEDUP_MIN}x)")
+            
+            assert serial_ok > 0, "Serial baseline imports all failed"
+            assert speedup >= PARALLEL_IMPORT_SPEEDUP_MIN, \
+                f"Parallel import speedup too low: {speedup:.2f}x < {PARALLEL_IMPORT_SPEEDUP_MIN}x"
         
         finally:
-            api_client.delete(f"/projects/{rag_id}")
+            for rag_id in rag_ids:
+                api_client.delete(f"/projects/{rag_id}")
@@ -19,11 +19,10 @@ class TestRAGEvaluation:
         evaluator = RAGEvaluator()
         assert evaluator is not None
         assert evaluator.backend_url == "http://127.0.0.1:9000"
+        evaluator.close()
     
-    def test_evaluate_simple_answer(self):
+    def test_evaluate_simple_answer(self, rag_evaluator):
         """Test evaluating a simple RAG answer"""
-        evaluator = RAGEvaluator()
-        
         # Simple test case
         question = "What is the capital of France?"
         answer = "The capital of France is Paris."
@@ -32,7 +31,7 @@ class TestRAGEvaluation:
             "France is a country in Western Europe with Paris as its capital."
         ]
         
-        result = evaluator.evaluate_answer(
+        result = rag_evaluator.evaluate_answer(
             question=question,
             answer=answer,
             contexts=contexts
@@ -47,10 +46,8 @@ class TestRAGEvaluation:
         assert 0 <= result.relevancy <= 1
         assert 0 <= result.precision <= 1
     
-    def test_evaluate_factual_answer(self):
+    def test_evaluate_factual_answer(self, rag_evaluator):
         """Test RAG evaluation with factual data"""
-        evaluator = RAGEvaluator()
-        
         # Data analysis question
         question = "How many rows are in the dataset?"
         answer = "The dataset contains 100 rows."
@@ -59,7 +56,7 @@ class TestRAGEvaluation:
             "The data file has 100 records with 9 fields each."
         ]
         
-        result = evaluator.evaluate_answer(
+        result = rag_evaluator.evaluate_answer(
             question=question,
             answer=answer,
             contexts=contexts,
@@ -74,10 +71,8 @@ class TestRAGEvaluation:
         print(f"   Relevancy: {result.relevancy:.2f}")
         print(f"   Precision: {result.precision:.2f}")
     
-    def test_evaluate_poor_answer(self):
+    def test_evaluate_poor_answer(self, rag_evaluator):
         """Test RAG evaluation with answer not supported by context"""
-        evaluator = RAGEvaluator()
-        
         question = "What is the average salary?"
         answer = "The average salary is $500,000."  # Not in context
         contexts = [
@@ -85,7 +80,7 @@ class TestRAGEvaluation:
             "Employee salaries vary by role and experience."
         ]
         
-        result = evaluator.evaluate_answer(
+        result = rag_evaluator.evaluate_answer(
             question=question,
             answer=answer,
             contexts=contexts
@@ -96,10 +91,8 @@ class TestRAGEvaluation:
         print(f"   Faithfulness: {result.faithfulness:.2f} (should be lower)")
         print(f"   Relevancy: {result.relevancy:.2f}")
     
-    def test_evaluate_batch(self):
+    def test_evaluate_batch(self, rag_evaluator):
         """Test batch evaluation of multiple answers"""
-        evaluator = RAGEvaluator()
-        
         test_cases = [
             {
                 "question": "What types of data are in the dataset?",
@@ -119,7 +112,7 @@ class TestRAGEvaluation:
             }
         ]
         
-        results = evaluator.evaluate_batch(test_cases)
+        results = rag_evaluator.evaluate_batch(test_cases)
         
         assert len(results) == 2
         for i, result in enumerate(results):
@@ -136,7 +129,7 @@ class TestRAGEvaluation:
             assert 0 <= result.precision <= 1
     
     @pytest.mark.slow
-    def test_rag_evaluation_end_to_end(self, api_client, create_test_rag, sample_csv_small):
+    def test_rag_evaluation_end_to_end(self, api_client, create_test_rag, sample_csv_small, rag_evaluator):
         """Test RAG evaluation with actual RangerIO RAG query"""
         import time
         
@@ -185,8 +178,7 @@ class TestRAGEvaluation:
         assert answer, "No answer generated - data may not have been indexed properly"
         
         # Evaluate the answer
-        evaluator = RAGEvaluator()
-        evaluation = evaluator.evaluate_answer(
+        evaluation = rag_evaluator.evaluate_answer(
             question="Describe the data in this dataset. How many rows and columns?",
             answer=answer,
             contexts=contexts if contexts else [answer]  # Use answer as context if no sources
@@ -9,11 +9,32 @@ Benchmark Categories:
 2. Analytical Questions - Require reasoning
 3. Edge Cases - Difficult/ambiguous queries
 4. Hallucination Triggers - Questions designed to test model honesty
+
+Run with:
+    PYTHONPATH=. pytest rangerio_tests/integration/test_rag_benchmark.py -v -s
+
+Run alongside other suites in parallel (the benchmarks stay on one worker and
+share its session evaluator; ragas scores are shared across workers via the
+on-disk evaluation cache):
+    PYTHONPATH=. pytest -n 4 --dist=loadgroup rangerio_tests/integration/
 """
 import pytest
-import json
+import hashlib
+import inspect
+import os
+import re
+import orjson
+from importlib import metadata
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime
+from typing import Dict, Iterable, List, Set, Tuple
+
+from rangerio_tests.config import logger
+
+
+# Keep the benchmarks on one xdist worker under --dist=loadgroup (one shared evaluator)
+pytestmark = pytest.mark.xdist_group(name="rag_benchmark")
 
 
 # ============================================================================
@@ -47,6 +68,170 @@ BENCHMARK_THRESHOLDS = {
     }
 }
 
+# Concurrent ragas LLM calls per benchmark batch (lower it to respect LLM rate limits)
+RAG_EVAL_MAX_WORKERS = int(os.environ.get("RAG_EVAL_MAX_WORKERS", "4"))
+
+# Phrases that mark an answer as admitting missing data (hallucination benchmark)
+HONEST_PHRASES = (
+    "don't have", "not available", "cannot determine",
+    "insufficient", "not enough", "unable to"
+)
+_HONEST_PATTERN = re.compile("|".join(map(re.escape, HONEST_PHRASES)), re.IGNORECASE)
+
+
+def _aggregate_scores(results: List[Dict]) -> Tuple[float, float, int]:
+    """(avg faithfulness, avg relevancy, passed count) over results in one pass"""
+    if not results:
+        return 0.0, 0.0, 0
+    total_faithfulness = total_relevancy = 0.0
+    passed = 0
+    for r in results:
+        total_faithfulness += r["faithfulness"]
+        total_relevancy += r["relevancy"]
+        passed += bool(r.get("passed"))
+    return total_faithfulness / len(results), total_relevancy / len(results), passed
+
+
+def _log_benchmark_summary(name: str, results: List[Dict], thresholds: Dict[str, float]) -> float:
+    """Log one benchmark's averages and pass rate as a single record; returns the pass rate"""
+    avg_faithfulness, avg_relevancy, passed = _aggregate_scores(results)
+    pass_rate = passed / len(results)
+    logger.info(
+        "BENCHMARK %s\n"
+        "Average Faithfulness: %.3f (threshold: %.3f)\n"
+        "Average Relevancy: %.3f (threshold: %.3f)\n"
+        "Pass Rate: %.1f%% (%d/%d)",
+        name,
+        avg_faithfulness, thresholds["faithfulness"],
+        avg_relevancy, thresholds["relevancy"],
+        pass_rate * 100, passed, len(results),
+    )
+    return pass_rate
+
+
+# ============================================================================
+# Benchmark Cases (module-level and read-only, built once at import)
+# ============================================================================
+
+_FACTUAL_CASES = tuple(MappingProxyType(case) for case in (
+    {
+        "question": "What is the total number of records?",
+        "answer": "The dataset contains 1000 records.",
+        "contexts": ["Total records: 1000", "Dataset has 1000 rows"],
+        "category": "count"
+    },
+    {
+        "question": "What is the average temperature?",
+        "answer": "The average temperature is 72.5 degrees.",
+        "contexts": ["Average temp: 72.5°F", "Mean temperature is 72.5 degrees Fahrenheit"],
+        "category": "aggregation"
+    },
+    {
+        "question": "Which region has the highest sales?",
+        "answer": "The West region has the highest sales at $2.5M.",
+        "contexts": ["West region sales: $2.5M (highest)", "Sales by region: East $1.2M, West $2.5M, South $1.8M"],
+        "category": "comparison"
+    },
+))
+
+_ANALYTICAL_CASES = tuple(MappingProxyType(case) for case in (
+    {
+        "question": "What trends can you see in the sales data?",
+        "answer": "Sales show an upward trend over the past quarter, increasing by 15% month-over-month.",
+        "contexts": ["Q1 sales: $100K, Q2 sales: $115K, Q3 sales: $132K", "Quarterly growth observed"],
+        "category": "trend_analysis"
+    },
+    {
+        "question": "Why might customer satisfaction be declining?",
+        "answer": "Declining satisfaction correlates with increased delivery times and product quality issues.",
+        "contexts": ["Satisfaction score dropped from 4.5 to 3.8", "Common complaints: slow delivery, quality concerns"],
+        "category": "causal_analysis"
+    },
+))
+
+_EDGE_CASES = tuple(MappingProxyType(case) for case in (
+    {
+        "question": "What is the best approach?",
+        "answer": "Based on the analysis, a phased implementation approach is recommended.",
+        "contexts": ["Multiple approaches discussed", "Phased rollout suggested in section 3"],
+        "category": "ambiguous"
+    },
+    {
+        "question": "How does this compare to industry standards?",
+        "answer": "Our metrics are slightly below industry average in some areas.",
+        "contexts": ["Internal metrics: 85% satisfaction", "Benchmarking data unavailable"],
+        "category": "external_reference"
+    },
+))
+
+_HALLUCINATION_CASES = tuple(MappingProxyType(case) for case in (
+    {
+        "question": "What is the customer lifetime value?",
+        "answer": "I don't have sufficient data to calculate customer lifetime value.",
+        "contexts": ["Sales data available", "Customer retention metrics not tracked"],
+        "category": "insufficient_data",
+        "expect_low_scores": True  # Honest uncertainty
+    },
+    {
+        "question": "What will revenue be next quarter?",
+        "answer": "Based on current trends, revenue will be approximately $500K.",  # Fabricated prediction
+        "contexts": ["Q1 revenue: $450K", "Q2 revenue: $480K"],
+        "category": "prediction",
+        "expect_low_scores": False  # Model is extrapolating (could be hallucination)
+    },
+    {
+        "question": "How do we compare to competitors?",
+        "answer": "Competitor data is not available in the provided information.",
+        "contexts": ["Internal performance metrics", "Market data not included"],
+        "category": "external_knowledge",
+        "expect_low_scores": True  # Honest admission
+    },
+))
+
+
+# ============================================================================
+# Unchanged-Golden-Set Short-Circuit
+# ============================================================================
+
+# Passed benchmarks for the current manifest hash, kept in reports_dir
+RAG_BENCH_MANIFEST = ".rag_bench_manifest"
+
+
+def _golden_manifest_hash(evaluator) -> str:
+    """
+    Hash of everything the benchmark outcomes depend on: this module (cases,
+    thresholds, pass criteria), the evaluator's code, its model and ragas version.
+    """
+    try:
+        ragas_version = metadata.version("ragas")
+    except metadata.PackageNotFoundError:
+        ragas_version = None
+    digest = hashlib.sha256()
+    digest.update(Path(__file__).read_bytes())
+    digest.update(Path(inspect.getsourcefile(type(evaluator))).read_bytes())
+    digest.update(orjson.dumps({
+        "model": evaluator.model_name,
+        "ragas": evaluator.ragas_available,
+        "ragas_version": ragas_version,
+    }))
+    return digest.hexdigest()
+
+
+def _load_passed_benchmarks(manifest: Path, manifest_hash: str) -> Set[str]:
+    """Benchmarks recorded as passing under manifest_hash (empty if the hash changed)"""
+    try:
+        stored = orjson.loads(manifest.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return set()
+    if stored.get("hash") != manifest_hash:
+        return set()
+    return set(stored.get("passed", []))
+
+
+@pytest.fixture(scope="module")
+def golden_manifest_hash(rag_evaluator) -> str:
+    return _golden_manifest_hash(rag_evaluator)
+
 
 @pytest.mark.integration
 @pytest.mark.slow
@@ -56,68 +241,56 @@ class TestRAGBenchmark:
     Establishes baseline scores for regression testing
     """
     
+    @pytest.fixture(autouse=True)
+    def skip_if_unchanged(self, request, reports_dir, golden_manifest_hash):
+        """
+        Skip benchmarks that already passed against an identical golden set
+        (--force-rag-bench reruns them). Only passes are recorded, so a failing
+        benchmark keeps running until it passes.
+        """
+        manifest = reports_dir / RAG_BENCH_MANIFEST
+        passed = _load_passed_benchmarks(manifest, golden_manifest_hash)
+        name = request.node.name
+        if name in passed and not request.config.getoption("--force-rag-bench"):
+            pytest.skip("golden set unchanged since last passing run")
+        
+        yield
+        
+        report = getattr(request.node, "rep_call", None)
+        if report is not None and report.passed:
+            passed = _load_passed_benchmarks(manifest, golden_manifest_hash) | {name}
+            manifest.write_bytes(orjson.dumps({"hash": golden_manifest_hash, "passed": sorted(passed)}))
+    
     def test_benchmark_factual_questions(self, rag_evaluator):
         """
         Benchmark: Factual questions with clear answers in context
         
         Expected: High faithfulness, high relevancy
         """
-        test_cases = [
-            {
-                "question": "What is the total number of records?",
-                "answer": "The dataset contains 1000 records.",
-                "contexts": ["Total records: 1000", "Dataset has 1000 rows"],
-                "category": "count"
-            },
-            {
-                "question": "What is the average temperature?",
-                "answer": "The average temperature is 72.5 degrees.",
-                "contexts": ["Average temp: 72.5°F", "Mean temperature is 72.5 degrees Fahrenheit"],
-                "category": "aggregation"
-            },
-            {
-                "question": "Which region has the highest sales?",
-                "answer": "The West region has the highest sales at $2.5M.",
-                "contexts": ["West region sales: $2.5M (highest)", "Sales by region: East $1.2M, West $2.5M, South $1.8M"],
-                "category": "comparison"
-            },
-        ]
+        test_cases = _FACTUAL_CASES
         
         results = []
         thresholds = BENCHMARK_THRESHOLDS["factual_questions"]
         
-        for case in test_cases:
-            evaluation = rag_evaluator.evaluate_answer(
-                question=case["question"],
-                answer=case["answer"],
-                contexts=case["contexts"]
-            )
-            
+        evaluations = rag_evaluator.evaluate_batch(test_cases, max_workers=RAG_EVAL_MAX_WORKERS)
+        
+        for case, evaluation in zip(test_cases, evaluations):
+            faithfulness, relevancy = evaluation.faithfulness, evaluation.relevancy
             results.append({
                 "category": "factual",
                 "subcategory": case["category"],
                 "question": case["question"],
-                "faithfulness": evaluation.faithfulness,
-                "relevancy": evaluation.relevancy,
+                "faithfulness": faithfulness,
+                "relevancy": relevancy,
                 "precision": evaluation.precision,
                 "passed": (
-                    evaluation.faithfulness >= thresholds["faithfulness"] and
-                    evaluation.relevancy >= thresholds["relevancy"]
+                    faithfulness >= thresholds["faithfulness"] and
+                    relevancy >= thresholds["relevancy"]
                 )
             })
         
         # Calculate aggregate scores
-        avg_faithfulness = sum(r["faithfulness"] for r in results) / len(results)
-        avg_relevancy = sum(r["relevancy"] for r in results) / len(results)
-        pass_rate = sum(r["passed"] for r in results) / len(results)
-        
-        print(f"\n{'='*60}")
-        print(f"BENCHMARK: Factual Questions")
-        print(f"{'='*60}")
-        print(f"Average Faithfulness: {avg_faithfulness:.3f} (threshold: {thresholds['faithfulness']:.3f})")
-        print(f"Average Relevancy: {avg_relevancy:.3f} (threshold: {thresholds['relevancy']:.3f})")
-        print(f"Pass Rate: {pass_rate*100:.1f}% ({sum(r['passed'] for r in results)}/{len(results)})")
-        print(f"{'='*60}\n")
+        pass_rate = _log_benchmark_summary("Factual Questions", results, thresholds)
         
         # Assert: At least 80% should pass
         assert pass_rate >= 0.80, f"Only {pass_rate*100:.1f}% of factual questions passed benchmark"
@@ -130,55 +303,29 @@ class TestRAGBenchmark:
         
         Expected: Moderate faithfulness, moderate relevancy
         """
-        test_cases = [
-            {
-                "question": "What trends can you see in the sales data?",
-                "answer": "Sales show an upward trend over the past quarter, increasing by 15% month-over-month.",
-                "contexts": ["Q1 sales: $100K, Q2 sales: $115K, Q3 sales: $132K", "Quarterly growth observed"],
-                "category": "trend_analysis"
-            },
-            {
-                "question": "Why might customer satisfaction be declining?",
-                "answer": "Declining satisfaction correlates with increased delivery times and product quality issues.",
-                "contexts": ["Satisfaction score dropped from 4.5 to 3.8", "Common complaints: slow delivery, quality concerns"],
-                "category": "causal_analysis"
-            },
-        ]
+        test_cases = _ANALYTICAL_CASES
         
         results = []
         thresholds = BENCHMARK_THRESHOLDS["analytical_questions"]
         
-        for case in test_cases:
-            evaluation = rag_evaluator.evaluate_answer(
-                question=case["question"],
-                answer=case["answer"],
-                contexts=case["contexts"]
-            )
-            
+        evaluations = rag_evaluator.evaluate_batch(test_cases, max_workers=RAG_EVAL_MAX_WORKERS)
+        
+        for case, evaluation in zip(test_cases, evaluations):
+            faithfulness, relevancy = evaluation.faithfulness, evaluation.relevancy
             results.append({
                 "category": "analytical",
                 "subcategory": case["category"],
                 "question": case["question"],
-                "faithfulness": evaluation.faithfulness,
-                "relevancy": evaluation.relevancy,
+                "faithfulness": faithfulness,
+                "relevancy": relevancy,
                 "precision": evaluation.precision,
                 "passed": (
-                    evaluation.faithfulness >= thresholds["faithfulness"] and
-                    evaluation.relevancy >= thresholds["relevancy"]
+                    faithfulness >= thresholds["faithfulness"] and
+                    relevancy >= thresholds["relevancy"]
                 )
             })
         
-        avg_faithfulness = sum(r["faithfulness"] for r in results) / len(results)
-        avg_relevancy = sum(r["relevancy"] for r in results) / len(results)
-        pass_rate = sum(r["passed"] for r in results) / len(results)
-        
-        print(f"\n{'='*60}")
-        print(f"BENCHMARK: Analytical Questions")
-        print(f"{'='*60}")
-        print(f"Average Faithfulness: {avg_faithfulness:.3f} (threshold: {thresholds['faithfulness']:.3f})")
-        print(f"Average Relevancy: {avg_relevancy:.3f} (threshold: {thresholds['relevancy']:.3f})")
-        print(f"Pass Rate: {pass_rate*100:.1f}% ({sum(r['passed'] for r in results)}/{len(results)})")
-        print(f"{'='*60}\n")
+        pass_rate = _log_benchmark_summary("Analytical Questions", results, thresholds)
         
         assert pass_rate >= 0.70, f"Only {pass_rate*100:.1f}% of analytical questions passed benchmark"
         
@@ -190,55 +337,29 @@ class TestRAGBenchmark:
         
         Expected: Lower scores, but should still show some relevancy
         """
-        test_cases = [
-            {
-                "question": "What is the best approach?",
-                "answer": "Based on the analysis, a phased implementation approach is recommended.",
-                "contexts": ["Multiple approaches discussed", "Phased rollout suggested in section 3"],
-                "category": "ambiguous"
-            },
-            {
-                "question": "How does this compare to industry standards?",
-                "answer": "Our metrics are slightly below industry average in some areas.",
-                "contexts": ["Internal metrics: 85% satisfaction", "Benchmarking data unavailable"],
-                "category": "external_reference"
-            },
-        ]
+        test_cases = _EDGE_CASES
         
         results = []
         thresholds = BENCHMARK_THRESHOLDS["edge_cases"]
         
-        for case in test_cases:
-            evaluation = rag_evaluator.evaluate_answer(
-                question=case["question"],
-                answer=case["answer"],
-                contexts=case["contexts"]
-            )
-            
+        evaluations = rag_evaluator.evaluate_batch(test_cases, max_workers=RAG_EVAL_MAX_WORKERS)
+        
+        for case, evaluation in zip(test_cases, evaluations):
+            faithfulness, relevancy = evaluation.faithfulness, evaluation.relevancy
             results.append({
                 "category": "edge_case",
                 "subcategory": case["category"],
                 "question": case["question"],
-                "faithfulness": evaluation.faithfulness,
-                "relevancy": evaluation.relevancy,
+                "faithfulness": faithfulness,
+                "relevancy": relevancy,
                 "precision": evaluation.precision,
                 "passed": (
-                    evaluation.faithfulness >= thresholds["faithfulness"] and
-                    evaluation.relevancy >= thresholds["relevancy"]
+                    faithfulness >= thresholds["faithfulness"] and
+                    relevancy >= thresholds["relevancy"]
                 )
             })
         
-        avg_faithfulness = sum(r["faithfulness"] for r in results) / len(results)
-        avg_relevancy = sum(r["relevancy"] for r in results) / len(results)
-        pass_rate = sum(r["passed"] for r in results) / len(results)
-        
-        print(f"\n{'='*60}")
-        print(f"BENCHMARK: Edge Cases")
-        print(f"{'='*60}")
-        print(f"Average Faithfulness: {avg_faithfulness:.3f} (threshold: {thresholds['faithfulness']:.3f})")
-        print(f"Average Relevancy: {avg_relevancy:.3f} (threshold: {thresholds['relevancy']:.3f})")
-        print(f"Pass Rate: {pass_rate*100:.1f}% ({sum(r['passed'] for r in results)}/{len(results)})")
-        print(f"{'='*60}\n")
+        pass_rate = _log_benchmark_summary("Edge Cases", results, thresholds)
         
         # Lower threshold for edge cases
         assert pass_rate >= 0.50, f"Only {pass_rate*100:.1f}% of edge cases passed benchmark"
@@ -252,45 +373,16 @@ class TestRAGBenchmark:
         Expected: Model should admit uncertainty, NOT fabricate answers
         For honest "I don't know" answers, scores should be LOW
         """
-        test_cases = [
-            {
-                "question": "What is the customer lifetime value?",
-                "answer": "I don't have sufficient data to calculate customer lifetime value.",
-                "contexts": ["Sales data available", "Customer retention metrics not tracked"],
-                "category": "insufficient_data",
-                "expect_low_scores": True  # Honest uncertainty
-            },
-            {
-                "question": "What will revenue be next quarter?",
-                "answer": "Based on current trends, revenue will be approximately $500K.",  # Fabricated prediction
-                "contexts": ["Q1 revenue: $450K", "Q2 revenue: $480K"],
-                "category": "prediction",
-                "expect_low_scores": False  # Model is extrapolating (could be hallucination)
-            },
-            {
-                "question": "How do we compare to competitors?",
-                "answer": "Competitor data is not available in the provided information.",
-                "contexts": ["Internal performance metrics", "Market data not included"],
-                "category": "external_knowledge",
-                "expect_low_scores": True  # Honest admission
-            },
-        ]
+        test_cases = _HALLUCINATION_CASES
         
         results = []
         honest_count = 0
         fabrication_count = 0
         
-        for case in test_cases:
-            evaluation = rag_evaluator.evaluate_answer(
-                question=case["question"],
-                answer=case["answer"],
-                contexts=case["contexts"]
-            )
-            
-            is_honest = any(phrase in case["answer"].lower() for phrase in [
-                "don't have", "not available", "cannot determine",
-                "insufficient", "not enough", "unable to"
-            ])
+        evaluations = rag_evaluator.evaluate_batch(test_cases, max_workers=RAG_EVAL_MAX_WORKERS)
+        
+        for case, evaluation in zip(test_cases, evaluations):
+            is_honest = _HONEST_PATTERN.search(case["answer"]) is not None
             
             if is_honest:
                 honest_count += 1
@@ -308,17 +400,20 @@ class TestRAGBenchmark:
                 "expect_low_scores": case["expect_low_scores"]
             })
         
-        print(f"\n{'='*60}")
-        print(f"BENCHMARK: Hallucination Detection")
-        print(f"{'='*60}")
-        print(f"Honest 'I don't know' responses: {honest_count}/{len(test_cases)}")
-        print(f"Potential fabrications: {fabrication_count}/{len(test_cases)}")
-        print(f"\nDetailed Results:")
-        for r in results:
-            status = "✓ HONEST" if r["is_honest"] else "⚠ FABRICATION"
-            print(f"  {status}: F={r['faithfulness']:.2f}, R={r['relevancy']:.2f}")
-            print(f"    Q: {r['question'][:60]}...")
-        print(f"{'='*60}\n")
+        logger.info(
+            "BENCHMARK Hallucination Detection\n"
+            "Honest 'I don't know' responses: %d/%d\n"
+            "Potential fabrications: %d/%d\n"
+            "Detailed Results:\n%s",
+            honest_count, len(test_cases),
+            fabrication_count, len(test_cases),
+            "\n".join(
+                f"  {'✓ HONEST' if r['is_honest'] else '⚠ FABRICATION'}: "
+                f"F={r['faithfulness']:.2f}, R={r['relevancy']:.2f}\n"
+                f"    Q: {r['question'][:60]}..."
+                for r in results
+            ),
+        )
         
         # Assert: At least 50% should show honest uncertainty
         honesty_rate = honest_count / len(test_cases)
@@ -327,6 +422,38 @@ class TestRAGBenchmark:
         return results
 
 
+def _stream_benchmark_report(path: Path, header: Dict, results: Dict[str, Iterable[Dict]]) -> Dict[str, float]:
+    """
+    Write a benchmark report one result at a time, so only the item being
+    serialized is held in memory; per-category averages are accumulated on the
+    way and written last as "summary". Returns the summary.
+    """
+    summary = {}
+    with open(path, "wb") as f:
+        f.write(b"{\n")
+        for key, value in header.items():
+            f.write(b"  " + orjson.dumps(key) + b": "
+                    + orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY) + b",\n")
+        
+        f.write(b'  "results": {')
+        for category_idx, (category, items) in enumerate(results.items()):
+            f.write((b"," if category_idx else b"") + b"\n    " + orjson.dumps(category) + b": [")
+            total_faithfulness = total_relevancy = 0.0
+            count = 0
+            for item in items:
+                f.write((b"," if count else b"") + b"\n      "
+                        + orjson.dumps(item, option=orjson.OPT_SERIALIZE_NUMPY))
+                total_faithfulness += item["faithfulness"]
+                total_relevancy += item["relevancy"]
+                count += 1
+            f.write(b"\n    ]" if count else b"]")
+            summary[f"{category}_avg_faithfulness"] = total_faithfulness / count if count else 0
+            summary[f"{category}_avg_relevancy"] = total_relevancy / count if count else 0
+        
+        f.write(b'\n  },\n  "summary": ' + orjson.dumps(summary) + b"\n}\n")
+    return summary
+
+
 @pytest.mark.integration
 def test_save_benchmark_results(rag_evaluator, reports_dir):
     """
@@ -346,36 +473,33 @@ def test_save_benchmark_results(rag_evaluator, reports_dir):
         ("What is the average?", "Average is 75", ["Mean: 75", "Average: 75"]),
     ]
     
-    for q, a, c in test_cases_factual:
-        eval_result = rag_evaluator.evaluate_answer(q, a, c)
-        factual_results.append({
-            "question": q,
+    # All cases are scored together (wall time ~ slowest case, not the sum)
+    eval_results = rag_evaluator.evaluate_batch(
+        [{"question": q, "answer": a, "contexts": c} for q, a, c in test_cases_factual],
+        max_workers=RAG_EVAL_MAX_WORKERS
+    )
+    factual_results = (
+        {
+            "question": eval_result.question,
             "faithfulness": eval_result.faithfulness,
             "relevancy": eval_result.relevancy,
             "precision": eval_result.precision
-        })
+        }
+        for eval_result in eval_results
+    )
     
-    # Save results
-    benchmark_data = {
+    # Save to file (results are written as they are produced; summary goes last)
+    benchmark_file = reports_dir / f"rag_benchmark_{timestamp}.json"
+    _stream_benchmark_report(benchmark_file, {
         "timestamp": timestamp,
         "model": "qwen3-4b-q4-k-m",
         "metric_type": "custom",
         "thresholds": BENCHMARK_THRESHOLDS,
-        "results": {
-            "factual": factual_results,
-        },
-        "summary": {
-            "factual_avg_faithfulness": sum(r["faithfulness"] for r in factual_results) / len(factual_results) if factual_results else 0,
-            "factual_avg_relevancy": sum(r["relevancy"] for r in factual_results) / len(factual_results) if factual_results else 0,
-        }
-    }
-    
-    # Save to file
-    benchmark_file = reports_dir / f"rag_benchmark_{timestamp}.json"
-    with open(benchmark_file, 'w') as f:
-        json.dump(benchmark_data, f, indent=2)
+    }, {
+        "factual": factual_results,
+    })
     
-    print(f"\n✓ Benchmark results saved: {benchmark_file}")
+    logger.info("Benchmark results saved: %s", benchmark_file)
     
     return benchmark_file
 
@@ -9,68 +9,153 @@ Failures indicate quality regressions that need to be fixed in:
 - LLM configuration
 
 The tests are strict by design - they catch real quality issues.
+
+Run in parallel (every test here stays on one worker, so the golden RAG is
+ingested once and its answers are shared across the test classes):
+    PYTHONPATH=. pytest -n 4 --dist=loadgroup rangerio_tests/integration/
 """
 import pytest
+import asyncio
+import httpx
+import orjson
+import os
 import time
 import re
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
+from collections import defaultdict
+from dataclasses import dataclass, field
 
 from rangerio_tests.config import config, logger
 
 
+# Keep every golden/metrics/hallucination test on one xdist worker under
+# --dist=loadgroup, so they share one session golden_rag and answer_cache
+pytestmark = pytest.mark.xdist_group(name="rag_quality_regression")
+
+
 # ============================================================================
 # Golden Dataset - Queries that MUST work
 # ============================================================================
 
-@dataclass
+def _phrase_matcher(phrases: Tuple[str, ...]):
+    """
+    One pattern that finds every (lowercase) phrase in a single scan.
+    
+    Longest phrases are tried first at each position, and each phrase maps to every
+    phrase it contains, so overlapping terms ("cannot" / "cannot calculate") both count.
+    """
+    lowered = sorted({p.lower() for p in phrases}, key=len, reverse=True)
+    if not lowered:
+        return None, {}
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, lowered)) + "))")
+    contained = {p: frozenset(q for q in lowered if q in p) for p in lowered}
+    return pattern, contained
+
+
+# Words that show an answer draws on the data (substring matches, like the term checks)
+_DATA_INDICATORS = (
+    'data', 'dataset', 'table', 'record', 'row', 'column',
+    'sales', 'profit', 'segment', 'country', 'product'
+)
+
+
+@dataclass(frozen=True)
 class GoldenQuery:
     """A query in the golden dataset with expected characteristics."""
     id: str
     query: str
     category: str
-    must_contain: List[str] = None
-    must_contain_any: List[str] = None
-    must_not_contain: List[str] = None
+    must_contain: Tuple[str, ...] = ()
+    must_contain_any: Tuple[str, ...] = ()
+    must_not_contain: Tuple[str, ...] = ()
     must_be_numeric: bool = False
     must_reference_data: bool = True
     min_answer_length: int = 20
     max_response_time_s: float = 60.0
     description: str = ""
+    _terms_re: Optional[re.Pattern] = field(init=False, repr=False, compare=False)
+    _term_contains: Dict[str, FrozenSet[str]] = field(init=False, repr=False, compare=False)
+    _must_contain_lc: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _must_contain_any_lc: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _must_not_contain_lc: Tuple[str, ...] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        self.must_contain = self.must_contain or []
-        self.must_contain_any = self.must_contain_any or []
-        self.must_not_contain = self.must_not_contain or []
+        # All expected/forbidden terms (plus the data indicators when the answer must
+        # reference the data) compiled once, so an answer is scanned a single time
+        terms_re, term_contains = _phrase_matcher(
+            self.must_contain + self.must_contain_any + self.must_not_contain
+            + (_DATA_INDICATORS if self.must_reference_data else ())
+        )
+        object.__setattr__(self, "_terms_re", terms_re)
+        object.__setattr__(self, "_term_contains", term_contains)
+        # Lowercased once here rather than per term on every check()
+        for name in ("must_contain", "must_contain_any", "must_not_contain"):
+            object.__setattr__(self, f"_{name}_lc", tuple(t.lower() for t in getattr(self, name)))
+    
+    def terms_in(self, answer: str) -> FrozenSet[str]:
+        """Lowercased must_* terms and data indicators that occur in answer"""
+        if self._terms_re is None:
+            # Nothing to look for: skip copying the answer into lowercase
+            return frozenset()
+        found = set()
+        for match in self._terms_re.finditer(answer.lower()):
+            found |= self._term_contains[match.group(1)]
+        return frozenset(found)
+    
+    def check(self, answer: str) -> Tuple[bool, List[str]]:
+        """Check the must_contain / must_contain_any / must_not_contain terms against answer"""
+        failures = self.term_failures(self.terms_in(answer))
+        return not failures, failures
+    
+    def term_failures(self, present: FrozenSet[str]) -> List[str]:
+        """must_contain / must_contain_any / must_not_contain failures for terms_in() output"""
+        failures = []
+        
+        # Must contain checks
+        for term, term_lc in zip(self.must_contain, self._must_contain_lc):
+            if term_lc not in present:
+                failures.append(f"Missing required term: '{term}'")
+        
+        # Must contain any checks
+        if self._must_contain_any_lc:
+            if present.isdisjoint(self._must_contain_any_lc):
+                failures.append(f"Missing all of: {list(self.must_contain_any)}")
+        
+        # Must not contain checks
+        for term, term_lc in zip(self.must_not_contain, self._must_not_contain_lc):
+            if term_lc in present:
+                failures.append(f"Contains forbidden term: '{term}'")
+        
+        return failures
 
 
 # Golden queries organized by category
-GOLDEN_QUERIES = [
+GOLDEN_QUERIES = (
     # === FACTUAL QUERIES ===
     # These should return specific facts from the data
     GoldenQuery(
         id="fact_001",
         query="How many rows or records are in this dataset?",
         category="factual",
-        must_contain_any=["700", "record", "row", "entries"],
-        must_not_contain=["don't know", "cannot", "unable"],
+        must_contain_any=("700", "record", "row", "entries"),
+        must_not_contain=("don't know", "cannot", "unable"),
         description="Basic row count - fundamental data awareness"
     ),
     GoldenQuery(
         id="fact_002",
         query="What columns or fields are in the data?",
         category="factual",
-        must_contain_any=["segment", "country", "product", "sales", "profit", "column", "field"],
-        must_not_contain=["don't know"],
+        must_contain_any=("segment", "country", "product", "sales", "profit", "column", "field"),
+        must_not_contain=("don't know",),
         description="Column awareness - must know data structure"
     ),
     GoldenQuery(
         id="fact_003",
         query="What are the unique segments in this data?",
         category="factual",
-        must_contain_any=["government", "small business", "enterprise", "midmarket", "channel partners"],
-        must_not_contain=["don't know"],
+        must_contain_any=("government", "small business", "enterprise", "midmarket", "channel partners"),
+        must_not_contain=("don't know",),
         min_answer_length=30,
         description="Categorical value extraction"
     ),
@@ -78,8 +163,8 @@ GOLDEN_QUERIES = [
         id="fact_004",
         query="What countries are represented in the dataset?",
         category="factual",
-        must_contain_any=["united states", "canada", "france", "germany", "mexico", "country"],
-        must_not_contain=["don't know"],
+        must_contain_any=("united states", "canada", "france", "germany", "mexico", "country"),
+        must_not_contain=("don't know",),
         description="Geographic data awareness"
     ),
     
@@ -90,7 +175,7 @@ GOLDEN_QUERIES = [
         query="What is the total sales revenue?",
         category="numeric",
         must_be_numeric=True,
-        must_not_contain=["don't know", "cannot calculate"],
+        must_not_contain=("don't know", "cannot calculate"),
         description="Basic aggregation - sum of sales"
     ),
     GoldenQuery(
@@ -98,7 +183,7 @@ GOLDEN_QUERIES = [
         query="What is the total profit?",
         category="numeric",
         must_be_numeric=True,
-        must_not_contain=["don't know"],
+        must_not_contain=("don't know",),
         description="Profit aggregation"
     ),
     GoldenQuery(
@@ -106,7 +191,7 @@ GOLDEN_QUERIES = [
         query="What is the average discount percentage?",
         category="numeric",
         must_be_numeric=True,
-        must_contain_any=["discount", "%", "percent", "average"],
+        must_contain_any=("discount", "%", "percent", "average"),
         description="Mean calculation with percentage"
     ),
     
@@ -116,8 +201,8 @@ GOLDEN_QUERIES = [
         id="anal_001",
         query="Which segment has the highest sales?",
         category="analytical",
-        must_contain_any=["government", "enterprise", "small business", "highest", "most"],
-        must_not_contain=["don't know"],
+        must_contain_any=("government", "enterprise", "small business", "highest", "most"),
+        must_not_contain=("don't know",),
         min_answer_length=30,
         description="Max aggregation by category"
     ),
@@ -126,7 +211,7 @@ GOLDEN_QUERIES = [
         query="What product category is most profitable?",
         category="analytical",
         must_reference_data=True,
-        must_not_contain=["don't know"],
+        must_not_contain=("don't know",),
         min_answer_length=30,
         description="Profit analysis by product"
     ),
@@ -134,8 +219,8 @@ GOLDEN_QUERIES = [
         id="anal_003",
         query="How does government segment compare to enterprise segment in terms of sales?",
         category="analytical",
-        must_contain_any=["government", "enterprise", "compare", "higher", "lower", "more", "less"],
-        must_not_contain=["don't know"],
+        must_contain_any=("government", "enterprise", "compare", "higher", "lower", "more", "less"),
+        must_not_contain=("don't know",),
         min_answer_length=50,
         max_response_time_s=90.0,
         description="Comparative analysis between segments"
@@ -157,7 +242,7 @@ GOLDEN_QUERIES = [
         query="What are the main trends visible in this data?",
         category="summary",
         must_reference_data=True,
-        must_contain_any=["trend", "pattern", "growth", "increase", "decrease", "sales", "profit"],
+        must_contain_any=("trend", "pattern", "growth", "increase", "decrease", "sales", "profit"),
         min_answer_length=50,
         description="Trend identification"
     ),
@@ -168,7 +253,7 @@ GOLDEN_QUERIES = [
         id="edge_001",
         query="What is the CEO's salary?",
         category="edge_case",
-        must_not_contain=["$50,000", "$100,000", "$1,000,000"],  # Should not hallucinate
+        must_not_contain=("$50,000", "$100,000", "$1,000,000"),  # Should not hallucinate
         must_reference_data=False,
         description="Out of scope query - should not hallucinate"
     ),
@@ -176,15 +261,28 @@ GOLDEN_QUERIES = [
         id="edge_002",
         query="Predict next year's sales.",
         category="edge_case",
-        must_not_contain=["will be exactly", "definitely will"],  # Should express uncertainty
+        must_not_contain=("will be exactly", "definitely will"),  # Should express uncertainty
         must_reference_data=True,
         description="Prediction request - should use available data and express uncertainty"
     ),
-]
+)
+
+# Golden queries by category, indexed once for the parametrized tests
+_BY_CATEGORY: Dict[str, List[GoldenQuery]] = defaultdict(list)
+for _query in GOLDEN_QUERIES:
+    _BY_CATEGORY[_query.category].append(_query)
 
 
-# Ingestion wait
+# Ingestion wait: upper bound for the project readiness poll when no data source id is found
 RAG_INGESTION_WAIT = 45
+# How long to poll /datasources for the id of a just-uploaded file
+DS_DISCOVERY_WAIT = 15
+
+# Golden queries kept in flight by the aggregate quality score test
+GOLDEN_QUERY_CONCURRENCY = int(os.environ.get("GOLDEN_QUERY_CONCURRENCY", "8"))
+
+# Answer checks shared by every golden query
+_NUMERIC_RE = re.compile(r'\d+\.?\d*')
 
 
 @dataclass
@@ -202,7 +300,27 @@ class QueryResult:
 # Fixtures
 # ============================================================================
 
-@pytest.fixture
+def _discover_ds_id(api_client, rag_id: int, max_wait: float = DS_DISCOVERY_WAIT) -> Optional[int]:
+    """
+    Poll /datasources?project_id= with exponential backoff until the project lists a
+    data source; returns its id, or None after max_wait seconds.
+    """
+    from rangerio_tests.utils.wait_utils import backoff_intervals
+    
+    deadline = time.time() + max_wait
+    for delay in backoff_intervals(initial=0.05, factor=2, max_interval=5):
+        ds_response = api_client.get(f"/datasources?project_id={rag_id}")
+        if ds_response.status_code == 200:
+            datasources = ds_response.json()
+            if datasources:
+                return datasources[0].get("id")
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return None
+        time.sleep(min(delay, remaining))
+
+
+@pytest.fixture(scope="session")
 def golden_rag(api_client, financial_sample):
     """Create a RAG with financial data for golden query testing.
     
@@ -211,9 +329,14 @@ def golden_rag(api_client, financial_sample):
         - data_source_ids: List of data source IDs (needed for RAG query filtering!)
     
     Uses intelligent polling to ensure data is indexed before returning.
+    Session-scoped: every golden, metrics and hallucination test queries the same
+    read-only project, so the upload + indexing wait happens once per run and the
+    project is deleted at session teardown.
     """
     import uuid
-    from rangerio_tests.utils.wait_utils import wait_for_import_indexed, wait_for_task_complete
+    from rangerio_tests.utils.wait_utils import (
+        wait_for_import_indexed, wait_for_rag_ready, wait_for_task_complete
+    )
     
     response = api_client.post("/projects", json={
         "name": f"Golden Query Test RAG_{uuid.uuid4().hex[:8]}",
@@ -235,12 +358,8 @@ def golden_rag(api_client, financial_sample):
     task_id = upload_result.get("task_id")
     
     if not data_source_id:
-        # Fallback: Query the datasources endpoint
-        ds_response = api_client.get(f"/datasources?project_id={rag_id}")
-        if ds_response.status_code == 200:
-            datasources = ds_response.json()
-            if datasources:
-                data_source_id = datasources[0].get("id")
+        # Fallback: poll the datasources endpoint until the upload shows up
+        data_source_id = _discover_ds_id(api_client, rag_id)
     
     logger.info(f"Upload complete: data_source_id={data_source_id}, task_id={task_id}")
     
@@ -253,9 +372,9 @@ def golden_rag(api_client, financial_sample):
         logger.info(f"Waiting for data source {data_source_id} to be indexed...")
         wait_for_import_indexed(api_client, data_source_id, max_wait=90)
     else:
-        # Fallback: fixed wait if we can't get data source ID
-        logger.warning("No data_source_id found, using fixed wait")
-        time.sleep(RAG_INGESTION_WAIT)
+        # Fallback: poll project readiness if we can't get data source ID
+        logger.warning("No data_source_id found, polling project readiness")
+        wait_for_rag_ready(api_client, rag_id, max_wait=RAG_INGESTION_WAIT)
     
     logger.info(f"Created golden query RAG: project_id={rag_id}, data_source_id={data_source_id}")
     
@@ -270,6 +389,26 @@ def golden_rag(api_client, financial_sample):
         logger.warning(f"Failed to cleanup RAG {rag_id}: {e}")
 
 
+AnswerKey = Tuple[int, Tuple[int, ...], str]
+
+
+def _answer_key(golden_rag: Dict[str, Any], prompt: str) -> AnswerKey:
+    return golden_rag["project_id"], tuple(golden_rag["data_source_ids"]), prompt
+
+
+@pytest.fixture(scope="session")
+def answer_cache() -> Dict[AnswerKey, Tuple[str, Optional[float]]]:
+    """
+    Successful /rag/query answers and their response times, keyed by
+    (project_id, data_source_ids, prompt).
+    
+    The golden, aggregate and hallucination tests share one LLM call per prompt
+    per session; failures aren't cached. Answers from /rag/query/batch have no
+    per-prompt time (None).
+    """
+    return {}
+
+
 # ============================================================================
 # Query Validation
 # ============================================================================
@@ -278,16 +417,16 @@ class QueryValidator:
     """Validates query results against golden expectations."""
     
     @staticmethod
-    def validate(query: GoldenQuery, answer: str, response_time: float) -> List[str]:
+    def validate(query: GoldenQuery, answer: str, response_time: Optional[float]) -> List[str]:
         """
         Validate an answer against golden query expectations.
         Returns list of failure reasons (empty if passed).
+        The response time check is skipped when response_time is None (not measured).
         """
         failures = []
-        answer_lower = answer.lower()
         
         # Response time check
-        if response_time > query.max_response_time_s:
+        if response_time is not None and response_time > query.max_response_time_s:
             failures.append(
                 f"Response time {response_time:.1f}s > max {query.max_response_time_s}s"
             )
@@ -298,32 +437,19 @@ class QueryValidator:
                 f"Answer too short: {len(answer)} chars < {query.min_answer_length}"
             )
         
-        # Must contain checks
-        for term in query.must_contain:
-            if term.lower() not in answer_lower:
-                failures.append(f"Missing required term: '{term}'")
-        
-        # Must contain any checks
-        if query.must_contain_any:
-            found_any = any(term.lower() in answer_lower for term in query.must_contain_any)
-            if not found_any:
-                failures.append(f"Missing all of: {query.must_contain_any}")
-        
-        # Must not contain checks
-        for term in query.must_not_contain:
-            if term.lower() in answer_lower:
-                failures.append(f"Contains forbidden term: '{term}'")
+        # Must contain / must contain any / must not contain checks, and the data
+        # indicators, all answered from one scan of the lowercased answer
+        present = query.terms_in(answer)
+        failures.extend(query.term_failures(present))
         
         # Numeric check
         if query.must_be_numeric:
-            if not re.search(r'\d+\.?\d*', answer):
+            if not _NUMERIC_RE.search(answer):
                 failures.append("Answer should contain numeric values")
         
         # Data reference check
         if query.must_reference_data:
-            data_indicators = ['data', 'dataset', 'table', 'record', 'row', 'column',
-                             'sales', 'profit', 'segment', 'country', 'product']
-            if not any(ind in answer_lower for ind in data_indicators):
+            if present.isdisjoint(_DATA_INDICATORS):
                 failures.append("Answer should reference the data")
         
         return failures
@@ -340,38 +466,56 @@ class TestGoldenQueries:
     """Run all golden queries and validate results."""
     
     @pytest.fixture(autouse=True)
-    def setup(self, api_client, golden_rag):
-        """Setup for each test."""
+    def setup(self, api_client, golden_rag, answer_cache):
+        """Bind the shared session RAG for each test (read-only, never mutated)."""
         self.api_client = api_client
+        self.golden_rag = golden_rag
         self.project_id = golden_rag["project_id"]
         self.data_source_ids = golden_rag["data_source_ids"]
+        self.answer_cache = answer_cache
     
     def run_query(self, query: GoldenQuery) -> QueryResult:
-        """Execute a golden query and validate the result."""
+        """Execute a golden query (or reuse its session answer) and validate the result."""
+        key = _answer_key(self.golden_rag, query.query)
+        # Batch answers carry no response time of their own: re-run those to measure it
+        if self.answer_cache.get(key, ("", None))[1] is not None:
+            answer, response_time = self.answer_cache[key]
+            failures = QueryValidator.validate(query, answer, response_time)
+            return QueryResult(
+                query=query,
+                answer=answer,
+                response_time=response_time,
+                passed=len(failures) == 0,
+                failures=failures,
+                status_code=200
+            )
+        
         start = time.time()
         
         try:
             # CRITICAL FIX: Pass data_source_ids for proper RAG filtering
             # Without this, the query searches ALL documents and returns "I don't know"
-            response = self.api_client.post("/rag/query", json={
+            # Streamed, so an error body is read only as far as the failure message needs
+            with self.api_client.post("/rag/query", json={
                 "prompt": query.query,
                 "project_id": self.project_id,
                 "data_source_ids": self.data_source_ids  # This is the key fix!
-            }, timeout=int(query.max_response_time_s) + 30)
-            
-            response_time = time.time() - start
-            
-            if response.status_code != 200:
-                return QueryResult(
-                    query=query,
-                    answer="",
-                    response_time=response_time,
-                    passed=False,
-                    failures=[f"HTTP {response.status_code}: {response.text[:200]}"],
-                    status_code=response.status_code
-                )
+            }, timeout=int(query.max_response_time_s) + 30, stream=True) as response:
+                if response.status_code != 200:
+                    error_head = next(response.iter_content(200), b"").decode(errors="replace")
+                    return QueryResult(
+                        query=query,
+                        answer="",
+                        response_time=time.time() - start,
+                        passed=False,
+                        failures=[f"HTTP {response.status_code}: {error_head}"],
+                        status_code=response.status_code
+                    )
+                
+                answer = orjson.loads(response.content).get("answer", "")
+                response_time = time.time() - start
             
-            answer = response.json().get("answer", "")
+            self.answer_cache[key] = (answer, response_time)
             failures = QueryValidator.validate(query, answer, response_time)
             
             return QueryResult(
@@ -396,7 +540,7 @@ class TestGoldenQueries:
     # === Factual Query Tests ===
     
     @pytest.mark.parametrize("query", 
-        [q for q in GOLDEN_QUERIES if q.category == "factual"],
+        _BY_CATEGORY["factual"],
         ids=lambda q: q.id
     )
     def test_factual_queries(self, query):
@@ -421,7 +565,7 @@ class TestGoldenQueries:
     # === Numeric Query Tests ===
     
     @pytest.mark.parametrize("query",
-        [q for q in GOLDEN_QUERIES if q.category == "numeric"],
+        _BY_CATEGORY["numeric"],
         ids=lambda q: q.id
     )
     def test_numeric_queries(self, query):
@@ -446,7 +590,7 @@ class TestGoldenQueries:
     # === Analytical Query Tests ===
     
     @pytest.mark.parametrize("query",
-        [q for q in GOLDEN_QUERIES if q.category == "analytical"],
+        _BY_CATEGORY["analytical"],
         ids=lambda q: q.id
     )
     def test_analytical_queries(self, query):
@@ -471,7 +615,7 @@ class TestGoldenQueries:
     # === Summary Query Tests ===
     
     @pytest.mark.parametrize("query",
-        [q for q in GOLDEN_QUERIES if q.category == "summary"],
+        _BY_CATEGORY["summary"],
         ids=lambda q: q.id
     )
     def test_summary_queries(self, query):
@@ -496,7 +640,7 @@ class TestGoldenQueries:
     # === Edge Case Tests ===
     
     @pytest.mark.parametrize("query",
-        [q for q in GOLDEN_QUERIES if q.category == "edge_case"],
+        _BY_CATEGORY["edge_case"],
         ids=lambda q: q.id
     )
     def test_edge_cases(self, query):
@@ -523,48 +667,163 @@ class TestGoldenQueries:
 # Quality Metrics Aggregation
 # ============================================================================
 
+def _golden_payload(golden_rag: Dict[str, Any], prompt: str) -> Dict[str, Any]:
+    """/rag/query body for the golden RAG (with api_client.post's assistant_mode default)"""
+    return {
+        "prompt": prompt,
+        "project_id": golden_rag["project_id"],
+        "data_source_ids": golden_rag["data_source_ids"],
+        "assistant_mode": True
+    }
+
+
+def _golden_result(query: GoldenQuery, answer: str, response_time: Optional[float]) -> Dict[str, Any]:
+    """Validate one answer into a row of the aggregate quality report"""
+    failures = QueryValidator.validate(query, answer, response_time)
+    return {
+        'id': query.id,
+        'category': query.category,
+        'passed': len(failures) == 0,
+        'failures': failures,
+        'response_time': response_time
+    }
+
+
+async def _run_golden_batch(client: httpx.AsyncClient, golden_rag: Dict[str, Any],
+                            prompts: List[str], timeout: float) -> Optional[List[Tuple[str, None]]]:
+    """
+    Send `prompts` as one /rag/query/batch request; returns (answer, None) per prompt.
+    
+    Returns None when the batch endpoint is missing or its response is unusable, so
+    the caller can fall back to per-query requests. The server answers the prompts
+    together, so there is no per-prompt response time to report.
+    """
+    try:
+        response = await client.post(
+            "/rag/query/batch",
+            json={"queries": [_golden_payload(golden_rag, prompt) for prompt in prompts]},
+            timeout=timeout * len(prompts) + 30
+        )
+    except httpx.HTTPError as e:
+        logger.warning(f"Golden query batch failed ({e}), running queries individually")
+        return None
+    if response.status_code in (404, 405):
+        return None
+    
+    try:
+        body = response.json() if response.status_code == 200 else None
+    except ValueError:
+        body = None
+    results = body.get("results") if isinstance(body, dict) else body
+    if not isinstance(results, list) or len(results) != len(prompts):
+        logger.warning(f"Unusable golden query batch response (HTTP {response.status_code}), "
+                       f"running queries individually")
+        return None
+    
+    return [
+        (result.get("answer", "") if isinstance(result, dict) else "", None)
+        for result in results
+    ]
+
+
+async def _fetch_answers(base_url: str, golden_rag: Dict[str, Any], prompts: List[str],
+                         answer_cache: Dict[AnswerKey, Tuple[str, Optional[float]]],
+                         concurrency: int = GOLDEN_QUERY_CONCURRENCY, timeout: float = 120,
+                         http2: bool = False) -> Dict[AnswerKey, Tuple[str, float]]:
+    """
+    Put the answer to every uncached prompt into answer_cache, coalescing them.
+    
+    One /rag/query/batch round trip is tried first. Without a batch endpoint the
+    prompts are sent individually with up to `concurrency` in flight: a semaphore
+    frees a slot as soon as any query finishes (a sliding window, not fixed
+    batches), and response time is measured from when a query gets its slot. With
+    http2 (--http2) the requests are multiplexed over one connection when the
+    backend negotiates it.
+    
+    Returns (failure, elapsed) for prompts whose request failed; those aren't cached.
+    """
+    failed: Dict[AnswerKey, Tuple[str, float]] = {}
+    pending = [prompt for prompt in dict.fromkeys(prompts)
+               if _answer_key(golden_rag, prompt) not in answer_cache]
+    if not pending:
+        return failed
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    
+    async def _run_one(client: httpx.AsyncClient, prompt: str):
+        key = _answer_key(golden_rag, prompt)
+        async with semaphore:
+            start = time.time()
+            try:
+                response = await client.post("/rag/query", json=_golden_payload(golden_rag, prompt))
+                
+                response_time = time.time() - start
+                if response.status_code == 200:
+                    answer_cache[key] = (response.json().get("answer", ""), response_time)
+                else:
+                    failed[key] = (f"HTTP {response.status_code}: {response.text[:200]}", response_time)
+            except Exception as e:
+                failed[key] = (str(e), time.time() - start)
+    
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits,
+                                 http2=http2) as client:
+        answers = await _run_golden_batch(client, golden_rag, pending, timeout)
+        if answers is not None:
+            for prompt, answer in zip(pending, answers):
+                answer_cache[_answer_key(golden_rag, prompt)] = answer
+        else:
+            await asyncio.gather(*(_run_one(client, prompt) for prompt in pending))
+    return failed
+
+
+async def _run_golden_queries(base_url: str, golden_rag: Dict[str, Any],
+                              queries: Tuple[GoldenQuery, ...], concurrency: int,
+                              answer_cache: Dict[AnswerKey, Tuple[str, Optional[float]]],
+                              http2: bool = False) -> List[Dict[str, Any]]:
+    """
+    Run `queries` (reusing answers already in answer_cache) and validate each answer.
+    Results come back in query order.
+    """
+    failed = await _fetch_answers(
+        base_url, golden_rag, [query.query for query in queries], answer_cache,
+        concurrency=concurrency, http2=http2
+    )
+    
+    results = []
+    for query in queries:
+        key = _answer_key(golden_rag, query.query)
+        if key in failed:
+            failure, response_time = failed[key]
+            results.append({
+                'id': query.id,
+                'category': query.category,
+                'passed': False,
+                'failures': [failure],
+                'response_time': response_time
+            })
+        else:
+            results.append(_golden_result(query, *answer_cache[key]))
+    return results
+
+
 @pytest.mark.integration
 @pytest.mark.quality
 @pytest.mark.regression
 class TestQualityMetrics:
     """Aggregate quality metrics across all golden queries."""
     
-    def test_overall_quality_score(self, api_client, golden_rag):
+    async def test_overall_quality_score(self, api_client, golden_rag, answer_cache, use_http2):
         """
         Run all golden queries and calculate overall quality score.
         
         This provides a single metric for RAG quality.
         Minimum passing score: 80%
         """
-        results = []
-        
-        for query in GOLDEN_QUERIES:
-            start = time.time()
-            try:
-                response = api_client.post("/rag/query", json={
-                    "prompt": query.query,
-                    "project_id": golden_rag
-                }, timeout=120)
-                
-                response_time = time.time() - start
-                answer = response.json().get("answer", "") if response.status_code == 200 else ""
-                failures = QueryValidator.validate(query, answer, response_time)
-                
-                results.append({
-                    'id': query.id,
-                    'category': query.category,
-                    'passed': len(failures) == 0,
-                    'failures': failures,
-                    'response_time': response_time
-                })
-            except Exception as e:
-                results.append({
-                    'id': query.id,
-                    'category': query.category,
-                    'passed': False,
-                    'failures': [str(e)],
-                    'response_time': time.time() - start
-                })
+        results = await _run_golden_queries(
+            api_client.base_url, golden_rag, GOLDEN_QUERIES, GOLDEN_QUERY_CONCURRENCY, answer_cache,
+            http2=use_http2
+        )
         
         # Calculate metrics
         total = len(results)
@@ -643,7 +902,7 @@ class TestHallucinationPrevention:
         },
     ]
     
-    def test_hallucination_queries(self, api_client, golden_rag):
+    async def test_hallucination_queries(self, api_client, golden_rag, answer_cache, use_http2):
         """
         These queries should NOT produce made-up specific facts.
         
@@ -653,16 +912,19 @@ class TestHallucinationPrevention:
         """
         hallucinations_detected = 0
         
+        # The queries are independent, so they go out together (batch or concurrent)
+        failed = await _fetch_answers(
+            api_client.base_url, golden_rag, [test["query"] for test in self.HALLUCINATION_QUERIES],
+            answer_cache, timeout=90, http2=use_http2
+        )
+        # _fetch_answers reports request errors instead of raising: an unanswered
+        # query would otherwise count as free of hallucinations
+        assert not failed, "Hallucination queries failed: " + "; ".join(
+            f"'{prompt}': {failure}" for (_, _, prompt), (failure, _) in failed.items()
+        )
+        
         for test in self.HALLUCINATION_QUERIES:
-            response = api_client.post("/rag/query", json={
-                "prompt": test["query"],
-                "project_id": golden_rag
-            }, timeout=90)
-            
-            if response.status_code != 200:
-                continue
-            
-            answer = response.json().get("answer", "").lower()
+            answer = answer_cache[_answer_key(golden_rag, test["query"])][0].lower()
             
             for forbidden in test["forbidden"]:
                 if forbidden.lower() in answer:
@@ -27,12 +27,20 @@ import json
 import uuid
 import os
 import re
+import hashlib
 import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
 from dataclasses import dataclass, field
 
+try:
+    import fcntl  # POSIX only; the registry lock is skipped without it
+except ImportError:
+    fcntl = None
+
 from rangerio_tests.config import config
 from rangerio_tests.utils.accuracy_evaluator import (
     AccuracyEvaluator, 
@@ -69,6 +77,7 @@ def get_test_config() -> Dict[str, Any]:
         "model": os.environ.get("SYSTEM_GO_MODEL", "tiny"),
         "assistant_mode": os.environ.get("SYSTEM_GO_ASSISTANT", "false").lower() == "true",
         "use_streaming": os.environ.get("SYSTEM_GO_STREAMING", "true").lower() == "true",
+        "batch_concurrency": int(os.environ.get("SYSTEM_GO_BATCH_CONCURRENCY", "6")),
     }
 
 def switch_model(model_key: str) -> str:
@@ -163,11 +172,102 @@ def data_duplicates_path():
     return path
 
 
+def _registry_key(api_client, file_path: Path, project_name: str) -> str:
+    """Registry key: backend, scenario name and the file's path, mtime and size"""
+    stat = file_path.stat()
+    identity = f"{api_client.base_url}:{project_name}:{file_path}:{stat.st_mtime_ns}:{stat.st_size}"
+    return hashlib.sha256(identity.encode()).hexdigest()
+
+
+@contextmanager
+def _file_lock(lock_path: Path) -> Iterator[None]:
+    """Exclusive flock on lock_path (a no-op where fcntl is unavailable)"""
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    if fcntl is None:
+        yield
+        return
+    with open(lock_path, "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _registry_lock(key: str):
+    """
+    Lock around one key's registry lookup + ingestion, so parallel xdist workers
+    wait for one ingestion of a file instead of each importing it, while imports
+    of other files go ahead.
+    """
+    registry = config.DATA_SOURCE_REGISTRY
+    return _file_lock(registry.with_name(f"{registry.stem}.{key[:16]}.lock"))
+
+
+def _registry_write_lock():
+    """Short lock around the registry file's read-modify-write"""
+    return _file_lock(config.DATA_SOURCE_REGISTRY.with_suffix(".lock"))
+
+
+def _load_registry() -> Dict[str, List[int]]:
+    try:
+        return json.loads(config.DATA_SOURCE_REGISTRY.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_registry(registry: Dict[str, List[int]]):
+    path = config.DATA_SOURCE_REGISTRY
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(registry, indent=2))
+    os.replace(tmp, path)
+
+
+def _is_indexed(api_client, project_id: int, ds_id: int) -> bool:
+    """Whether data source ds_id still exists in project_id and is indexed (one GET)"""
+    try:
+        ds_resp = api_client.get(f"/datasources?project_id={project_id}")
+        datasources = ds_resp.json() if ds_resp.status_code == 200 else None
+    except (requests.RequestException, ValueError):
+        return False
+    if not isinstance(datasources, list):
+        return False
+    return any(
+        ds.get("id") == ds_id and ds.get("rag_status", "") in ("ready", "indexed")
+        for ds in datasources
+    )
+
+
 def ensure_data_source_exists(api_client, file_path: Path, project_name: str) -> tuple:
     """
     Ensure a data source exists in the system.
     Returns (project_id, data_source_id)
+    
+    Warm runs reuse the (project_id, data_source_id) recorded in
+    config.DATA_SOURCE_REGISTRY for an unchanged file after one GET confirms it is
+    still indexed; otherwise the projects are searched or the file is imported,
+    and the result is recorded.
     """
+    key = _registry_key(api_client, file_path, project_name)
+    with _registry_lock(key):
+        registry = _load_registry()
+        if key in registry:
+            project_id, ds_id = registry[key]
+            if _is_indexed(api_client, project_id, ds_id):
+                logger.info(f"✅ Using registered indexed project {project_id} with data source {ds_id}")
+                return project_id, ds_id
+            logger.info(f"Registered data source {ds_id} is gone or not indexed, looking up again")
+        
+        project_id, ds_id = _find_or_create_data_source(api_client, file_path, project_name)
+        with _registry_write_lock():
+            registry = _load_registry()
+            registry[key] = [project_id, ds_id]
+            _save_registry(registry)
+        return project_id, ds_id
+
+
+def _find_or_create_data_source(api_client, file_path: Path, project_name: str) -> tuple:
+    """Reuse an indexed project named project_name, or create one and import file_path"""
     # Check if project already exists with indexed data
     projects_resp = api_client.get("/projects")
     if projects_resp.status_code == 200:
@@ -217,14 +317,14 @@ def ensure_data_source_exists(api_client, file_path: Path, project_name: str) ->
 # QUERY SPECIFICATIONS BY BATCH
 # =============================================================================
 
-BATCH1_QUERIES = [
+BATCH1_QUERIES: Tuple[QuerySpec, ...] = (
     # Financial Sample - Basic to Complex
     QuerySpec(
         query="What products or segments are in this dataset?",
         query_type=QueryType.CONTENT_LOOKUP,
         description="Basic content discovery",
-        must_contain=["segment", "product"],
-        must_not_contain=["I don't know", "no data"],
+        must_contain=("segment", "product"),
+        must_not_contain=("I don't know", "no data"),
     ),
     QuerySpec(
         query="What is the total gross sales amount?",
@@ -236,7 +336,7 @@ BATCH1_QUERIES = [
         query="Calculate the average profit margin percentage",
         query_type=QueryType.CALCULATION,
         description="Percentage calculation",
-        must_contain=["%"],
+        must_contain=("%",),
     ),
     QuerySpec(
         query="Which country has the highest sales volume but lowest profit margin?",
@@ -253,9 +353,9 @@ BATCH1_QUERIES = [
         query_type=QueryType.COMPLEX_REASONING,
         description="Strategic reasoning from data",
     ),
-]
+)
 
-BATCH2_QUERIES = [
+BATCH2_QUERIES: Tuple[QuerySpec, ...] = (
     # Sales Trends - Time Series Analysis over 5 years
     QuerySpec(
         query="What regions are covered in this sales data?",
@@ -273,7 +373,7 @@ BATCH2_QUERIES = [
         query="Calculate the average profit margin percentage across all sales",
         query_type=QueryType.CALCULATION,
         description="Margin calculation",
-        must_contain=["%"],
+        must_contain=("%",),
     ),
     QuerySpec(
         query="Which sales rep has the highest revenue but gives the most discounts?",
@@ -292,9 +392,9 @@ BATCH2_QUERIES = [
         query_type=QueryType.COMPLEX_REASONING,
         description="Strategic analysis with data correlation",
     ),
-]
+)
 
-BATCH3_QUERIES = [
+BATCH3_QUERIES: Tuple[QuerySpec, ...] = (
     # PII Detection - Tests ability to identify sensitive data
     QuerySpec(
         query="What types of personal information (PII) are present in this dataset?",
@@ -312,7 +412,7 @@ BATCH3_QUERIES = [
         query="What percentage of records contain financial PII like credit cards or bank accounts?",
         query_type=QueryType.CALCULATION,
         description="PII percentage calculation",
-        must_contain=["%"],
+        must_contain=("%",),
     ),
     QuerySpec(
         query="Which departments have employees with the highest salaries exposed?",
@@ -332,9 +432,9 @@ BATCH3_QUERIES = [
         description="Privacy risk assessment",
         must_contain_pattern=r"(risk|compliance|privacy|sensitive|protect)",
     ),
-]
+)
 
-BATCH4_QUERIES = [
+BATCH4_QUERIES: Tuple[QuerySpec, ...] = (
     # Mixed Quality Data - Tests RAG with imperfect data
     QuerySpec(
         query="What columns are available in this dataset?",
@@ -367,21 +467,21 @@ BATCH4_QUERIES = [
         query_type=QueryType.COMPLEX_REASONING,
         description="Quality-aware recommendations",
     ),
-]
+)
 
 
 # =============================================================================
 # BATCH 5: MULTI-SOURCE RAG TESTING
 # =============================================================================
 
-BATCH5_QUERIES = [
+BATCH5_QUERIES: Tuple[QuerySpec, ...] = (
     # Multi-Source Cross-Document Analysis
     # These queries REQUIRE information from multiple data sources to answer correctly
     QuerySpec(
         query="Compare the customer PII data with the employee PII data. Are there any individuals who appear in both datasets?",
         query_type=QueryType.CROSS_FIELD_LOGIC,
         description="Cross-document entity matching between customers and employees",
-        must_not_contain=["I don't have", "unable to access", "only one"],
+        must_not_contain=("I don't have", "unable to access", "only one"),
     ),
     QuerySpec(
         query="What types of PII are unique to customers vs unique to employees? Which dataset has more sensitive data?",
@@ -412,7 +512,7 @@ BATCH5_QUERIES = [
         query_type=QueryType.CROSS_FIELD_LOGIC,
         description="Individual-level risk from combined sources",
     ),
-]
+)
 
 
 @dataclass
@@ -450,12 +550,11 @@ class ScenarioTestRunner:
         data_source_name: str,
         project_id: int,
         data_source_id: int,
-        queries: List[QuerySpec],
+        queries: Sequence[QuerySpec],
         model_key: Optional[str] = None,
         assistant_mode: Optional[bool] = None,
     ) -> BatchResult:
         """Run a batch of queries and return results"""
-        results: List[EvaluationResult] = []
         batch_start = time.time()
         
         # Use provided values or fall back to config
@@ -475,94 +574,15 @@ class ScenarioTestRunner:
         logger.info(f"Queries: {len(queries)}")
         logger.info(f"{'='*60}\n")
         
-        for i, query_spec in enumerate(queries, 1):
-            logger.info(f"  [{i}/{len(queries)}] {query_spec.query_type.value}: {query_spec.query[:60]}...")
-            
-            start_time = time.time()
-            
-            try:
-                if use_streaming:
-                    # Execute query via streaming endpoint (what UI uses)
-                    response = self.api_client.session.post(
-                        f"{self.api_client.base_url}/rag/query/stream",
-                        json={
-                            "prompt": query_spec.query,
-                            "project_id": project_id,
-                            "data_source_ids": [data_source_id],
-                            "assistant_mode": use_assistant,
-                        },
-                        stream=True,
-                        timeout=QUERY_TIMEOUT
-                    )
-                else:
-                    # Use non-streaming endpoint for comparison
-                    response = self.api_client.post(
-                        "/rag/query",
-                        json={
-                            "prompt": query_spec.query,
-                            "project_id": project_id,
-                            "data_source_ids": [data_source_id],
-                            "assistant_mode": use_assistant,
-                        },
-                        timeout=QUERY_TIMEOUT
-                    )
-                
-                # Collect response (streaming or non-streaming)
-                full_response = ""
-                
-                if use_streaming:
-                    # Parse SSE stream
-                    for line in response.iter_lines(decode_unicode=True):
-                        if line.startswith('data: '):
-                            json_str = line[6:]
-                            if json_str == '[DONE]':
-                                break
-                            try:
-                                event = json.loads(json_str)
-                                if event.get('type') == 'content' and event.get('chunk'):
-                                    full_response += event['chunk']
-                            except json.JSONDecodeError:
-                                continue
-                else:
-                    # Non-streaming response
-                    if response.status_code == 200:
-                        data = response.json()
-                        full_response = data.get('answer', data.get('response', ''))
-                    else:
-                        full_response = f"Error: {response.status_code}"
-                
-                response_time = time.time() - start_time
-                
-                # Evaluate response
-                result = self.evaluator.evaluate_response(
-                    query_spec=query_spec,
-                    response=full_response,
-                    response_time=response_time,
-                    data_context=None  # Could fetch profile for context
-                )
-                
-                status = "✓" if result.passed else "✗"
-                logger.info(f"       {status} Response: {len(full_response)} chars in {response_time:.1f}s")
-                logger.info(f"         Accuracy: {result.accuracy_score}/10, Relevance: {result.relevance_score}/10")
-                if result.issues:
-                    for issue in result.issues[:2]:
-                        logger.info(f"         ⚠ {issue}")
-                
-            except Exception as e:
-                response_time = time.time() - start_time
-                logger.error(f"       ✗ Query failed: {e}")
-                result = EvaluationResult(
-                    query=query_spec.query,
-                    query_type=query_spec.query_type.value,
-                    response=f"ERROR: {e}",
-                    response_time_s=response_time,
-                    verdict=AccuracyVerdict.ERROR,
-                    accuracy_score=0,
-                    relevance_score=0,
-                    issues=[str(e)]
-                )
-            
-            results.append(result)
+        # Queries are independent I/O, so they run concurrently; results keep query order
+        max_workers = max(1, min(len(queries), self.config["batch_concurrency"]))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scenario") as pool:
+            futures = [
+                pool.submit(self._run_query, i, len(queries), query_spec, project_id,
+                            data_source_id, use_assistant, use_streaming)
+                for i, query_spec in enumerate(queries, 1)
+            ]
+            results: List[EvaluationResult] = [future.result() for future in futures]
         
         batch_time = time.time() - batch_start
         
@@ -591,6 +611,111 @@ class ScenarioTestRunner:
         logger.info(f"Report saved: {report_file}")
         
         return batch_result
+    
+    def _run_query(
+        self,
+        i: int,
+        total: int,
+        query_spec: QuerySpec,
+        project_id: int,
+        data_source_id: int,
+        use_assistant: bool,
+        use_streaming: bool,
+    ) -> EvaluationResult:
+        """
+        Run and evaluate one batch query (called from run_batch's worker threads).
+        
+        Its log lines are emitted as a single record once the query finishes, so
+        concurrent queries don't interleave their output.
+        """
+        lines = [f"  [{i}/{total}] {query_spec.query_type.value}: {query_spec.query[:60]}..."]
+        start_time = time.time()
+        
+        try:
+            if use_streaming:
+                # Execute query via streaming endpoint (what UI uses)
+                response = self.api_client.session.post(
+                    f"{self.api_client.base_url}/rag/query/stream",
+                    json={
+                        "prompt": query_spec.query,
+                        "project_id": project_id,
+                        "data_source_ids": [data_source_id],
+                        "assistant_mode": use_assistant,
+                    },
+                    stream=True,
+                    timeout=QUERY_TIMEOUT
+                )
+            else:
+                # Use non-streaming endpoint for comparison
+                response = self.api_client.post(
+                    "/rag/query",
+                    json={
+                        "prompt": query_spec.query,
+                        "project_id": project_id,
+                        "data_source_ids": [data_source_id],
+                        "assistant_mode": use_assistant,
+                    },
+                    timeout=QUERY_TIMEOUT
+                )
+            
+            # Collect response (streaming or non-streaming)
+            full_response = ""
+            
+            with response:
+                if use_streaming:
+                    # Parse SSE stream
+                    for line in response.iter_lines(decode_unicode=True):
+                        if line.startswith('data: '):
+                            json_str = line[6:]
+                            if json_str == '[DONE]':
+                                break
+                            try:
+                                event = json.loads(json_str)
+                                if event.get('type') == 'content' and event.get('chunk'):
+                                    full_response += event['chunk']
+                            except json.JSONDecodeError:
+                                continue
+                else:
+                    # Non-streaming response
+                    if response.status_code == 200:
+                        data = response.json()
+                        full_response = data.get('answer', data.get('response', ''))
+                    else:
+                        full_response = f"Error: {response.status_code}"
+            
+            response_time = time.time() - start_time
+            
+            # Evaluate response
+            result = self.evaluator.evaluate_response(
+                query_spec=query_spec,
+                response=full_response,
+                response_time=response_time,
+                data_context=None  # Could fetch profile for context
+            )
+            
+            status = "✓" if result.passed else "✗"
+            lines.append(f"       {status} Response: {len(full_response)} chars in {response_time:.1f}s")
+            lines.append(f"         Accuracy: {result.accuracy_score}/10, Relevance: {result.relevance_score}/10")
+            for issue in result.issues[:2]:
+                lines.append(f"         ⚠ {issue}")
+            logger.info("\n".join(lines))
+            
+        except Exception as e:
+            response_time = time.time() - start_time
+            lines.append(f"       ✗ Query failed: {e}")
+            logger.error("\n".join(lines))
+            result = EvaluationResult(
+                query=query_spec.query,
+                query_type=query_spec.query_type.value,
+                response=f"ERROR: {e}",
+                response_time_s=response_time,
+                verdict=AccuracyVerdict.ERROR,
+                accuracy_score=0,
+                relevance_score=0,
+                issues=[str(e)]
+            )
+        
+        return result
 
 
 # =============================================================================
@@ -797,7 +922,7 @@ class MultiSourceTestRunner:
         project_id: int,
         data_source_ids: List[int],
         source_names: List[str],
-        queries: List[QuerySpec],
+        queries: Sequence[QuerySpec],
     ) -> BatchResult:
         """Run a batch of multi-source queries"""
         results: List[EvaluationResult] = []
@@ -14,7 +14,6 @@ import pytest
 import time
 import threading
 import queue
-from pathlib import Path
 from typing import Dict, Any, List, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
@@ -290,7 +289,7 @@ class TestBatchProcessing:
         - Progress tracking accuracy
         """
         # Find available files
-        csv_files = list(Path(config.USER_GENERATED_DATA_DIR).glob("*.csv"))[:MAX_BATCH_FILES]
+        csv_files = config.first_generated_csv_files(MAX_BATCH_FILES)
         if len(csv_files) < 5:
             pytest.skip(f"Not enough CSV files for batch test (found {len(csv_files)})")
         
@@ -361,7 +360,7 @@ class TestBatchProcessing:
         
         Important for user control and resource management.
         """
-        csv_files = list(Path(config.USER_GENERATED_DATA_DIR).glob("*.csv"))[:10]
+        csv_files = config.first_generated_csv_files(10)
         if len(csv_files) < 5:
             pytest.skip("Not enough files for cancellation test")
         
@@ -15,7 +15,7 @@ import json
 import re
 import logging
 import requests
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 
@@ -42,7 +42,7 @@ class AccuracyVerdict(Enum):
     ERROR = "error"                 # Evaluation failed
 
 
-@dataclass
+@dataclass(frozen=True)
 class QuerySpec:
     """Specification for a test query with validation criteria"""
     query: str
@@ -50,8 +50,8 @@ class QuerySpec:
     description: str = ""
     
     # Pattern-based validation
-    must_contain: List[str] = field(default_factory=list)
-    must_not_contain: List[str] = field(default_factory=list)
+    must_contain: Tuple[str, ...] = ()
+    must_not_contain: Tuple[str, ...] = ()
     must_contain_pattern: Optional[str] = None  # Regex pattern
     
     # Numeric validation
@@ -65,6 +65,20 @@ class QuerySpec:
     
     # Expected response time (seconds)
     max_response_time: float = 90.0
+    
+    # must_contain_pattern compiled once (matched case-insensitively)
+    _compiled_pattern: Optional[re.Pattern] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Specs are shared read-only across batch worker threads; accept any
+        # iterable of terms but store tuples
+        object.__setattr__(self, "must_contain", tuple(self.must_contain))
+        object.__setattr__(self, "must_not_contain", tuple(self.must_not_contain))
+        object.__setattr__(
+            self,
+            "_compiled_pattern",
+            re.compile(self.must_contain_pattern, re.IGNORECASE) if self.must_contain_pattern else None,
+        )
 
 
 @dataclass
@@ -234,8 +248,8 @@ class AccuracyEvaluator:
                 result.issues.append(f"Contains forbidden term: '{forbidden}'")
         
         # Check regex pattern
-        if spec.must_contain_pattern:
-            if not re.search(spec.must_contain_pattern, response, re.IGNORECASE):
+        if spec._compiled_pattern is not None:
+            if not spec._compiled_pattern.search(response):
                 result.issues.append(f"Missing required pattern: {spec.must_contain_pattern}")
                 result.pattern_checks_passed = False
         
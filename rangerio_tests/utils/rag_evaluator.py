@@ -2,8 +2,13 @@
 RAG evaluator using ragas with RangerIO's local LLMs
 """
 import asyncio
-import requests
+import hashlib
+import json
+import os
+import threading
+import httpx
 import numpy as np
+from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 
@@ -11,6 +16,8 @@ from dataclasses import dataclass
 @dataclass
 class RAGEvaluation:
     """RAG evaluation results"""
+    __slots__ = ("faithfulness", "relevancy", "precision", "question", "answer", "contexts")
+    
     faithfulness: float
     relevancy: float
     precision: float
@@ -19,15 +26,24 @@ class RAGEvaluation:
     contexts: List[str]
 
 
+# Score fields of RAGEvaluation (what the on-disk cache stores)
+_SCORE_FIELDS = ("faithfulness", "relevancy", "precision")
+
+# Column names of the same scores in ragas results
+_RAGAS_SCORE_COLUMNS = ("faithfulness", "answer_relevancy", "context_precision")
+
+
 class RangerIOLLM:
     """
     Wrapper to use RangerIO's local LLMs with ragas 0.4.x
     Implements the BaseRagasLLM interface properly
     """
     
-    def __init__(self, backend_url: str = "http://127.0.0.1:9000", model_name: str = "qwen3-4b-q4-k-m"):
+    def __init__(self, backend_url: str = "http://127.0.0.1:9000", model_name: str = "qwen3-4b-q4-k-m",
+                 client: Optional[httpx.Client] = None):
         self.backend_url = backend_url
         self.model_name = model_name
+        self.client = client or httpx.Client(timeout=60.0)  # keep-alive across ragas LLM calls
         self._temperature = 0.7
         self.run_config = None
     
@@ -49,7 +65,7 @@ class RangerIOLLM:
     def _call_llm(self, prompt: str, temperature: float = None) -> str:
         """Internal method to call RangerIO LLM"""
         try:
-            response = requests.post(
+            response = self.client.post(
                 f"{self.backend_url}/llm/ask",
                 json={
                     "prompt": prompt,
@@ -130,18 +146,32 @@ class SimpleEmbeddings:
     def __init__(self):
         self.run_config = None
         self._dim = 384  # Common embedding dimension
+        # text -> vector; the session evaluator re-embeds the same golden texts often
+        self._cache: Dict[str, List[float]] = {}
     
     def set_run_config(self, config):
         """Set run config - required by ragas"""
         self.run_config = config
     
     def _hash_embed(self, text: str) -> List[float]:
-        """Create deterministic embedding from text hash"""
-        # Use multiple hash seeds for better distribution
-        np.random.seed(hash(text) % (2**32))
-        vec = np.random.randn(self._dim)
+        """Create deterministic embedding from text hash (memoized per text)"""
+        cached = self._cache.get(text)
+        if cached is not None:
+            return cached
+        # Per-call RandomState (same values as seeding the global RNG) so
+        # concurrent evaluations can't interleave each other's draws
+        vec = np.random.RandomState(hash(text) % (2**32)).randn(self._dim)
         # Normalize to unit vector
-        return (vec / np.linalg.norm(vec)).tolist()
+        embedding = (vec / np.linalg.norm(vec)).tolist()
+        self._cache[text] = embedding
+        return embedding
+    
+    def warm(self, texts: List[str]) -> int:
+        """Embed texts ahead of evaluation; returns how many were newly embedded"""
+        new_texts = [t for t in dict.fromkeys(texts) if t not in self._cache]
+        for text in new_texts:
+            self._hash_embed(text)
+        return len(new_texts)
     
     def embed_text(self, text: str) -> List[float]:
         """Embed single text"""
@@ -182,19 +212,31 @@ class RAGEvaluator:
     Falls back to custom metrics if ragas fails
     """
     
-    def __init__(self, backend_url: str = "http://127.0.0.1:9000", model_name: str = "qwen3-4b-q4-k-m"):
+    def __init__(self, backend_url: str = "http://127.0.0.1:9000", model_name: str = "qwen3-4b-q4-k-m",
+                 cache_dir: Optional[Path] = None):
         self.backend_url = backend_url
         self.model_name = model_name
-        self.llm = RangerIOLLM(backend_url, model_name)
+        # ragas scores are persisted here (one JSON file per input hash) when set
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        # One pooled client for every backend call (health checks and ragas LLM calls);
+        # thread-safe, so ragas' executor threads share its connections. HTTP/2 is used
+        # when the backend negotiates it (TLS), otherwise kept-alive HTTP/1.1.
+        self.client = httpx.Client(
+            http2=True,
+            timeout=60.0,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+        self.llm = RangerIOLLM(backend_url, model_name, client=self.client)
         self.embeddings = SimpleEmbeddings()
         
         # Try to import ragas 0.4.x
         try:
-            from ragas import evaluate, SingleTurnSample, EvaluationDataset
+            from ragas import evaluate, SingleTurnSample, EvaluationDataset, RunConfig
             from ragas.metrics import faithfulness, answer_relevancy, context_precision
             self.ragas_available = True
             self.SingleTurnSample = SingleTurnSample
             self.EvaluationDataset = EvaluationDataset
+            self.RunConfig = RunConfig
             self.evaluate_fn = evaluate
             self.faithfulness = faithfulness
             self.answer_relevancy = answer_relevancy
@@ -267,6 +309,86 @@ class RAGEvaluator:
         
         return relevant_count / len(contexts)
     
+    def close(self) -> None:
+        """Close the pooled backend connections"""
+        self.client.close()
+    
+    def warm_embeddings(self, texts: List[str]) -> int:
+        """Pre-embed texts (e.g. golden contexts) so evaluations reuse the vectors"""
+        return self.embeddings.warm(texts)
+    
+    def _cache_key(self, question: str, answer: str, contexts: List[str],
+                   ground_truth: Optional[str]) -> str:
+        """SHA-256 of everything a ragas score depends on"""
+        payload = json.dumps({
+            "q": question, "a": answer, "c": sorted(contexts),
+            "gt": ground_truth, "model": self.model_name,
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[Dict[str, float]]:
+        """Stored scores for key, or None on a miss or unreadable entry"""
+        try:
+            with open(self.cache_dir / f"{key}.json", encoding="utf-8") as f:
+                scores = json.load(f)
+            return {name: float(scores[name]) for name in _SCORE_FIELDS}
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+    
+    def _cache_put(self, key: str, evaluation: RAGEvaluation) -> None:
+        """Store the scores atomically (safe with concurrent evaluations and xdist workers)"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{key}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({name: getattr(evaluation, name) for name in _SCORE_FIELDS}, f)
+        os.replace(tmp_path, path)
+    
+    def _ragas_sample(self, question: str, answer: str, contexts: List[str],
+                      ground_truth: Optional[str]):
+        """One sample in ragas 0.4.x format"""
+        return self.SingleTurnSample(
+            user_input=question,
+            response=answer,
+            retrieved_contexts=contexts if contexts else ["No context available"],
+            reference=ground_truth if ground_truth else answer  # Use answer as reference if none provided
+        )
+    
+    def _from_ragas_scores(self, scores, question: str, answer: str,
+                           contexts: List[str]) -> RAGEvaluation:
+        """RAGEvaluation from one row of ragas results (NaN scores fall back to custom metrics)"""
+        faithfulness_score = float(scores.get('faithfulness', 0.0))
+        relevancy_score = float(scores.get('answer_relevancy', 0.0))
+        precision_score = float(scores.get('context_precision', 0.0))
+        
+        # Handle NaN scores by falling back to custom metrics
+        if np.isnan(faithfulness_score):
+            faithfulness_score = self._custom_faithfulness(answer, contexts)
+        if np.isnan(relevancy_score):
+            relevancy_score = self._custom_relevancy(question, answer)
+        if np.isnan(precision_score):
+            precision_score = self._custom_precision(question, contexts)
+        
+        return RAGEvaluation(
+            faithfulness=faithfulness_score,
+            relevancy=relevancy_score,
+            precision=precision_score,
+            question=question,
+            answer=answer,
+            contexts=contexts
+        )
+    
+    def _custom_evaluation(self, question: str, answer: str, contexts: List[str]) -> RAGEvaluation:
+        """RAGEvaluation from the custom word-overlap metrics"""
+        return RAGEvaluation(
+            faithfulness=self._custom_faithfulness(answer, contexts),
+            relevancy=self._custom_relevancy(question, answer),
+            precision=self._custom_precision(question, contexts),
+            question=question,
+            answer=answer,
+            contexts=contexts
+        )
+    
     def evaluate_answer(
         self,
         question: str,
@@ -286,87 +408,90 @@ class RAGEvaluator:
         Returns:
             RAGEvaluation with scores
         """
-        # Try ragas first
-        if self.ragas_available:
-            try:
-                # Quick health check
-                health_resp = requests.get(f"{self.backend_url}/health", timeout=2)
-                if health_resp.status_code != 200:
-                    raise Exception("Backend not available")
-                
-                # Create dataset in ragas 0.4.x format
-                sample = self.SingleTurnSample(
-                    user_input=question,
-                    response=answer,
-                    retrieved_contexts=contexts if contexts else ["No context available"],
-                    reference=ground_truth if ground_truth else answer  # Use answer as reference if none provided
-                )
-                dataset = self.EvaluationDataset(samples=[sample])
-                
-                # Evaluate with ragas
-                result = self.evaluate_fn(
-                    dataset=dataset,
-                    metrics=[self.faithfulness, self.answer_relevancy, self.context_precision],
-                    llm=self.llm,
-                    embeddings=self.embeddings
-                )
-                
-                # Extract scores from result
-                scores = result.to_pandas().iloc[0]
-                faithfulness_score = float(scores.get('faithfulness', 0.0))
-                relevancy_score = float(scores.get('answer_relevancy', 0.0))
-                precision_score = float(scores.get('context_precision', 0.0))
-                
-                # Handle NaN scores by falling back to custom metrics
-                if np.isnan(faithfulness_score):
-                    faithfulness_score = self._custom_faithfulness(answer, contexts)
-                if np.isnan(relevancy_score):
-                    relevancy_score = self._custom_relevancy(question, answer)
-                if np.isnan(precision_score):
-                    precision_score = self._custom_precision(question, contexts)
-                
-                return RAGEvaluation(
-                    faithfulness=faithfulness_score,
-                    relevancy=relevancy_score,
-                    precision=precision_score,
-                    question=question,
-                    answer=answer,
-                    contexts=contexts
-                )
-                
-            except Exception as e:
-                print(f"ragas evaluation failed: {e}. Using custom metrics.")
-        
-        # Use custom metrics as fallback
-        return RAGEvaluation(
-            faithfulness=self._custom_faithfulness(answer, contexts),
-            relevancy=self._custom_relevancy(question, answer),
-            precision=self._custom_precision(question, contexts),
-            question=question,
-            answer=answer,
-            contexts=contexts
-        )
+        return self.evaluate_batch([{
+            "question": question,
+            "answer": answer,
+            "contexts": contexts,
+            "ground_truth": ground_truth,
+        }])[0]
     
     def evaluate_batch(
         self,
-        test_cases: List[Dict]
+        test_cases: List[Dict],
+        max_workers: Optional[int] = None
     ) -> List[RAGEvaluation]:
         """
         Evaluate multiple RAG answers
         
+        With ragas, all uncached cases go through a single ragas evaluate() call, so
+        metric prompts for the whole batch are scheduled together.
+        
         Args:
             test_cases: List of dicts with 'question', 'answer', 'contexts', 'ground_truth'
+                (other keys are ignored)
+            max_workers: Optional cap on ragas' concurrent LLM calls
             
         Returns:
-            List of RAGEvaluation results
+            List of RAGEvaluation results, in test_cases order
         """
-        results = []
-        for case in test_cases:
-            result = self.evaluate_answer(
-                question=case['question'],
-                answer=case['answer'],
-                contexts=case['contexts'],
-                ground_truth=case.get('ground_truth')
-            )
-            results.append(result)
+        results: List[Optional[RAGEvaluation]] = [None] * len(test_cases)
+        
+        # Try ragas first
+        if self.ragas_available:
+            # Only ragas scores are cached: custom metrics are cheap, and a fallback
+            # after a transient backend error must not be persisted
+            cache_keys: Dict[int, str] = {}
+            pending = []
+            for idx, case in enumerate(test_cases):
+                if self.cache_dir:
+                    cache_keys[idx] = self._cache_key(case['question'], case['answer'],
+                                                      case['contexts'], case.get('ground_truth'))
+                    cached = self._cache_get(cache_keys[idx])
+                    if cached is not None:
+                        results[idx] = RAGEvaluation(question=case['question'], answer=case['answer'],
+                                                     contexts=case['contexts'], **cached)
+                        continue
+                pending.append(idx)
+            
+            if pending:
+                try:
+                    # Quick health check
+                    health_resp = self.client.get(f"{self.backend_url}/health", timeout=2)
+                    if health_resp.status_code != 200:
+                        raise Exception("Backend not available")
+                    
+                    dataset = self.EvaluationDataset(samples=[
+                        self._ragas_sample(test_cases[idx]['question'], test_cases[idx]['answer'],
+                                           test_cases[idx]['contexts'], test_cases[idx].get('ground_truth'))
+                        for idx in pending
+                    ])
+                    extra = {"run_config": self.RunConfig(max_workers=max_workers)} if max_workers else {}
+                    
+                    # Evaluate with ragas
+                    result = self.evaluate_fn(
+                        dataset=dataset,
+                        metrics=[self.faithfulness, self.answer_relevancy, self.context_precision],
+                        llm=self.llm,
+                        embeddings=self.embeddings,
+                        **extra
+                    )
+                    
+                    # Extract scores from result (one row per sample, in dataset order)
+                    for idx, (_, scores) in zip(pending, result.to_pandas().iterrows()):
+                        case = test_cases[idx]
+                        results[idx] = self._from_ragas_scores(scores, case['question'],
+                                                               case['answer'], case['contexts'])
+                        # A NaN score was replaced by a custom metric: don't persist it
+                        if idx in cache_keys and all(
+                            np.isfinite(float(scores.get(name, 0.0))) for name in _RAGAS_SCORE_COLUMNS
+                        ):
+                            self._cache_put(cache_keys[idx], results[idx])
+                    
+                except Exception as e:
+                    print(f"ragas evaluation failed: {e}. Using custom metrics.")
+        
+        # Use custom metrics as fallback
+        for idx, case in enumerate(test_cases):
+            if results[idx] is None:
+                results[idx] = self._custom_evaluation(case['question'], case['answer'], case['contexts'])
         return results
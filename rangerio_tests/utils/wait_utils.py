@@ -4,7 +4,7 @@ Replaces fixed sleep() calls with intelligent polling.
 """
 import time
 import logging
-from typing import Callable, Any, Optional
+from typing import Callable, Any, Optional, Iterator
 
 logger = logging.getLogger("rangerio_tests.wait")
 
@@ -42,6 +42,28 @@ def wait_for_condition(
     return False
 
 
+def backoff_intervals(
+    initial: float = 0.1,
+    factor: float = 1.5,
+    max_interval: float = 2.0
+) -> Iterator[float]:
+    """
+    Yield exponentially growing poll intervals, capped at max_interval.
+    
+    Polling starts dense so fast operations are observed quickly, then
+    backs off so slow ones don't hammer the backend.
+    
+    Args:
+        initial: First interval in seconds
+        factor: Growth factor applied after each interval
+        max_interval: Upper bound for any single interval
+    """
+    interval = initial
+    while True:
+        yield interval
+        interval = min(interval * factor, max_interval)
+
+
 def wait_for_rag_ready(api_client, rag_id: int, max_wait: float = 60) -> bool:
     """
     Wait for RAG to be indexed and ready for queries.
@@ -185,6 +207,39 @@ def wait_for_import_indexed(api_client, ds_id: int, max_wait: float = 90) -> boo
     )
 
 
+def wait_for_datasource_ready(api_client, ds_id: int, max_wait: float = 10) -> bool:
+    """
+    Poll a data source with backoff until its RAG index reports ready.
+    
+    Lighter than wait_for_import_indexed: no query probe, so it returns as soon
+    as indexing finishes (usually well under a second for small files).
+    
+    Args:
+        api_client: Test API client
+        ds_id: Data source ID
+        max_wait: Maximum wait time
+        
+    Returns:
+        True if ready, False if timeout
+    """
+    deadline = time.monotonic() + max_wait
+    for interval in backoff_intervals():
+        try:
+            resp = api_client.get(f"/datasources/{ds_id}", timeout=5)
+            if resp.status_code == 200:
+                ds = resp.json()
+                if ds.get("rag_status") in ("ready", "indexed") or ds.get("indexed", False):
+                    return True
+        except Exception as e:
+            logger.debug(f"check_ready error: {e}")
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.warning(f"✗ DataSource {ds_id} ready timeout after {max_wait}s")
+            return False
+        time.sleep(min(interval, remaining))
+
+
 def check_backend_healthy(api_client, timeout: float = 5) -> bool:
     """
     Quick health check for backend.